@@ -0,0 +1,119 @@
+import os
+import logging
+from src.utils.logging_utils import setup_logger
+from typing import Dict, List, Optional
+
+DEFAULT_RATIOS = (
+    "0.05,0.10,0.15,0.20,0.25,0.30,0.35,0.40,0.45,0.50,"
+    "0.55,0.60,0.65,0.70,0.75,0.80,0.85,0.90,0.95,1.0"
+)
+
+
+class ResampleConfigError(ValueError):
+    pass
+
+
+# Configure the logger
+logger = setup_logger(__name__, "transform_data.log", level=logging.DEBUG)
+
+
+def load_resample_config() -> Dict[str, list]:
+    """
+    Load the imbalance-ratio grid from environment variables
+    Set these in the .env file or in the deployment environment
+    as comma-separated lists, for example:
+        RESAMPLE_RATIOS=0.1,0.25,0.5
+        RESAMPLE_KINDS=borderline-1,borderline-2
+        RESAMPLE_SEEDS=42,7
+        RESAMPLE_WORKERS=4
+        RESAMPLE_REPLICATES=10
+    Unset variables default to the 20 ratios 0.05 to 1.0, borderline-1,
+    seed 42, a single process and one replicate per ratio.
+    :return: Dictionary with the ratios, kinds, seeds, workers and
+    replicates.
+    """
+
+    config = {
+        "ratios": _parse_list(
+            "RESAMPLE_RATIOS", os.getenv("RESAMPLE_RATIOS", DEFAULT_RATIOS),
+            float,
+        ),
+        "kinds": _parse_list(
+            "RESAMPLE_KINDS", os.getenv("RESAMPLE_KINDS", "borderline-1"),
+            str,
+        ),
+        "seeds": _parse_list(
+            "RESAMPLE_SEEDS", os.getenv("RESAMPLE_SEEDS", "42"), int
+        ),
+        "workers": _parse_int(
+            "RESAMPLE_WORKERS", os.getenv("RESAMPLE_WORKERS")
+        ),
+        "replicates": _parse_int(
+            "RESAMPLE_REPLICATES", os.getenv("RESAMPLE_REPLICATES") or "1"
+        ),
+    }
+
+    validate_resample_config(config)
+
+    return config
+
+
+def validate_resample_config(config):
+    # Kinds are checked by the resampling grid, which knows the engines
+    for ratio in config["ratios"]:
+        if not 0 < ratio <= 1:
+            _config_error(
+                f"RESAMPLE_RATIOS values must be in (0, 1], got {ratio}"
+            )
+        if round(ratio * 100) < 1:
+            _config_error(
+                "RESAMPLE_RATIOS values must round to an IR tag of at "
+                f"least 1, got {ratio}"
+            )
+    for seed in config["seeds"]:
+        if seed < 0:
+            _config_error(
+                f"RESAMPLE_SEEDS values must be non-negative, got {seed}"
+            )
+    if config["replicates"] < 1:
+        _config_error(
+            "RESAMPLE_REPLICATES must be at least 1, "
+            f"got {config['replicates']}"
+        )
+    if config["replicates"] > 1 and (
+        len(config["kinds"]) > 1 or len(config["seeds"]) > 1
+    ):
+        _config_error(
+            "RESAMPLE_REPLICATES draws every replicate from one kind and "
+            "seed; set a single RESAMPLE_KINDS and RESAMPLE_SEEDS value"
+        )
+    if config["workers"] is not None and config["workers"] < 1:
+        _config_error(
+            f"RESAMPLE_WORKERS must be at least 1, got {config['workers']}"
+        )
+
+
+def _parse_list(key, value, parse) -> List:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if not items:
+        _config_error(f"Configuration error: {key} is empty")
+    try:
+        return [parse(item) for item in items]
+    except ValueError:
+        _config_error(f"Configuration error: {key} has an invalid value")
+
+
+def _parse_int(key, value) -> Optional[int]:
+    if not value:
+        return None
+    if "," in value:
+        _config_error(f"Configuration error: {key} takes a single value")
+    try:
+        return int(value)
+    except ValueError:
+        _config_error(f"Configuration error: {key} is not a number")
+
+
+def _config_error(message):
+    logger.error(message)
+    raise ResampleConfigError(message)
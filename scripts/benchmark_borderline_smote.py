@@ -0,0 +1,75 @@
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+from src.extract.extract_abalone import FILE_PATH
+from src.transform.borderline_smote import (
+    fit_borderline_neighbours,
+    resample_from_neighbours,
+)
+from src.transform.resample_abalone import resample_with_borderline_smote
+from src.transform.standardize_encode_abalone import standardize_and_encode
+
+# Usage: python -m scripts.benchmark_borderline_smote [rows ...]
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+TARGET_RATIO = 1.0
+KINDS = ["borderline-1", "borderline-2"]
+
+
+def make_benchmark_data(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    # Abalone rows drawn with replacement and jittered, so the class
+    # balance and geometry match the real data without exact duplicates
+    abalone_df = pd.read_csv(FILE_PATH)
+    rng = np.random.default_rng(seed)
+    df = abalone_df.iloc[rng.integers(0, len(abalone_df), n_rows)]
+    df = df.reset_index(drop=True)
+    measurements = df.columns[1:8]
+    df[measurements] += rng.normal(0, 0.005, (n_rows, len(measurements)))
+    return standardize_and_encode(df)
+
+
+def time_call(func):
+    start_time = timeit.default_timer()
+    result = func()
+    return result, timeit.default_timer() - start_time
+
+
+def synthetic_summary(resampled: pd.DataFrame, n_rows: int) -> np.ndarray:
+    synthetic = resampled.iloc[n_rows:].drop(columns=["Class"])
+    return synthetic.to_numpy(dtype=np.float64).mean(axis=0)
+
+
+def main(sizes):
+    for n_rows in sizes:
+        df = make_benchmark_data(n_rows)
+        X, y = df.drop(columns=["Class"]), df["Class"]
+        for kind in KINDS:
+            reference, imblearn_time = time_call(
+                lambda: resample_with_borderline_smote(
+                    X, y, TARGET_RATIO, kind=kind
+                )
+            )
+            print(f"{n_rows} rows {kind}: imblearn {imblearn_time:.2f}s")
+            for dtype in (np.float64, np.float32):
+                graph, fit_time = time_call(
+                    lambda: fit_borderline_neighbours(
+                        X, y, kind=kind, dtype=dtype
+                    )
+                )
+                resampled, sample_time = time_call(
+                    lambda: resample_from_neighbours(graph, TARGET_RATIO)
+                )
+                mean_gap = np.abs(
+                    synthetic_summary(resampled, n_rows)
+                    - synthetic_summary(reference, n_rows)
+                ).max()
+                print(
+                    f"  engine {np.dtype(dtype).name}: "
+                    f"neighbours {fit_time:.2f}s, "
+                    f"resample {sample_time:.2f}s, "
+                    f"max synthetic mean gap {mean_gap:.2e}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
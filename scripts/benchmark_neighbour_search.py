@@ -0,0 +1,39 @@
+import sys
+import timeit
+import numpy as np
+from scripts.benchmark_borderline_smote import make_benchmark_data
+from src.transform.neighbour_search import NEIGHBOUR_BACKENDS, kneighbors
+
+# Usage: python -m scripts.benchmark_neighbour_search [rows ...]
+DEFAULT_SIZES = [100_000, 1_000_000]
+N_NEIGHBORS = 11  # the m-neighbour danger search of BorderlineSMOTE
+
+
+def recall(result: np.ndarray, exact: np.ndarray) -> float:
+    hits = [len(set(a) & set(b)) for a, b in zip(result, exact)]
+    return sum(hits) / exact.size
+
+
+def main(sizes):
+    for n_rows in sizes:
+        df = make_benchmark_data(n_rows)
+        data = df.drop(columns=["Class"]).to_numpy(dtype=np.float64)
+        # BorderlineSMOTE queries the minority rows against all rows
+        queries = data[df["Class"].to_numpy() == 1]
+        print(f"{n_rows} rows, {len(queries)} minority queries")
+
+        exact = None
+        for algorithm in NEIGHBOUR_BACKENDS:
+            start_time = timeit.default_timer()
+            result = kneighbors(data, queries, N_NEIGHBORS, algorithm)
+            execution_time = timeit.default_timer() - start_time
+            if exact is None:
+                exact = result
+            print(
+                f"  {algorithm}: {execution_time:.2f}s, "
+                f"recall@{N_NEIGHBORS} {recall(result, exact):.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
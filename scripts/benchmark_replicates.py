@@ -0,0 +1,48 @@
+import sys
+import logging
+from scripts.benchmark_borderline_smote import make_benchmark_data, time_call
+from src.transform.resample_abalone import (
+    build_version_grid,
+    generate_replicate_set,
+    generate_version_set,
+)
+
+# Usage: python -m scripts.benchmark_replicates [rows ...]
+DEFAULT_SIZES = [10_000, 100_000]
+REPLICATES = 10
+
+
+def main(sizes):
+    logging.disable(logging.INFO)
+    for n_rows in sizes:
+        df = make_benchmark_data(n_rows)
+        _, one_time = time_call(lambda: generate_version_set(df))
+        print(f"{n_rows} rows: 1 run {one_time:.2f}s")
+
+        _, rerun_time = time_call(
+            lambda: [
+                generate_version_set(
+                    df, grid=build_version_grid(seeds=[seed])
+                )
+                for seed in range(REPLICATES)
+            ]
+        )
+        print(f"  {REPLICATES} separate runs {rerun_time:.2f}s")
+
+        for nested in (False, True):
+            _, replicate_time = time_call(
+                lambda: generate_replicate_set(df, 1, nested=nested)
+            )
+            replicates, replicates_time = time_call(
+                lambda: generate_replicate_set(df, REPLICATES, nested=nested)
+            )
+            print(
+                f"  replicate set{' nested' if nested else ''}: "
+                f"1 replicate {replicate_time:.2f}s, "
+                f"{REPLICATES} replicates {replicates_time:.2f}s, "
+                f"{replicates.memory_usage() / 2**20:.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,123 @@
+import os
+import hashlib
+import logging
+import pandas as pd
+import pyarrow.feather as feather
+from src.extract import read_abalone_csv as abalone_reader
+from src.extract.extract_filters import (
+    filter_arrow_table,
+    filter_dataframe,
+    required_columns,
+)
+from src.utils.logging_utils import setup_logger
+
+# Parsed raw inputs are cached here, keyed by content rather than by name
+CACHE_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "data",
+    "cache",
+)
+
+HASH_BLOCK_SIZE = 1 << 20
+
+logger = setup_logger(__name__, "extract_data.log", level=logging.DEBUG)
+
+
+def file_content_hash(file_path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file's bytes.
+
+    Args:
+        file_path (str): Path to the file to hash.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def schema_fingerprint() -> str:
+    """
+    Fingerprint of the reader schema, so a cached parse is never served
+    to a reader that would have produced different columns or dtypes.
+
+    Returns:
+        str: Short hex digest of the schema version and declared dtypes.
+    """
+    dtypes = sorted(
+        (col, repr(dtype))
+        for col, dtype in abalone_reader.ABALONE_SCHEMA.items()
+    )
+    schema = (
+        f"{abalone_reader.SCHEMA_VERSION}:"
+        f"{abalone_reader.ABALONE_COLUMNS}:{dtypes}"
+    )
+    return hashlib.sha256(schema.encode()).hexdigest()[:16]
+
+
+def cache_path(file_path: str, cache_dir: str = CACHE_DIR) -> str:
+    """
+    Path of the cache entry for the current content of a raw file.
+
+    Args:
+        file_path (str): Path to the raw Abalone CSV file.
+        cache_dir (str): Directory holding the cache entries.
+
+    Returns:
+        str: Path to the Feather file for this content and schema.
+    """
+    key = f"{file_content_hash(file_path)}-{schema_fingerprint()}"
+    return os.path.join(cache_dir, f"abalone_{key}.feather")
+
+
+def read_abalone_csv_cached(
+    file_path: str, cache_dir: str = CACHE_DIR, columns=None, filters=None
+) -> pd.DataFrame:
+    """
+    Read a raw Abalone CSV through the typed reader, reusing a Feather
+    copy of an earlier parse of the same content when one exists.
+
+    Args:
+        file_path (str): Path to the raw Abalone CSV file.
+        cache_dir (str): Directory holding the cache entries.
+        columns: Columns to return, or None for all.
+        filters: (column, op, value) filters.
+
+    Returns:
+        pd.DataFrame: The typed Abalone frame.
+    """
+    entry = cache_path(file_path, cache_dir)
+
+    if os.path.exists(entry):
+        logger.info(f"Parsed input cache hit for {file_path}: {entry}")
+        # Uncompressed Feather is memory-mapped, so only the requested
+        # columns are paged in from the cache file rather than parsed
+        table = feather.read_table(
+            entry,
+            columns=required_columns(columns, filters),
+            memory_map=True,
+        )
+        table = filter_arrow_table(table, columns, filters)
+        return table.to_pandas(split_blocks=True)
+
+    logger.info(f"Parsed input cache miss for {file_path}")
+    abalone_df = abalone_reader.read_abalone_csv(file_path)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary name first so a concurrent or interrupted run
+    # never sees a partial entry
+    tmp_entry = f"{entry}.{os.getpid()}.tmp"
+    feather.write_feather(abalone_df, tmp_entry, compression="uncompressed")
+    os.replace(tmp_entry, entry)
+    logger.info(f"Parsed input cached at {entry}")
+
+    # The entry holds the full parse so any later projection can use it
+    return filter_dataframe(abalone_df, columns, filters).reset_index(
+        drop=True
+    )
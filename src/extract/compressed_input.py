@@ -0,0 +1,99 @@
+import io
+import pyarrow as pa
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Leading bytes of the compressed formats raw drops arrive in, mapped to
+# the Arrow codec that decompresses them
+MAGIC_NUMBERS = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"BZh": "bz2",
+}
+
+
+class CountingReader(io.RawIOBase):
+    """Read-only file object that counts the bytes read through it."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        return size
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self._stream.read()
+        else:
+            data = self._stream.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def close(self):
+        self._stream.close()
+        super().close()
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """
+    Detect the compression of a file from its leading bytes, so that
+    compressed drops are recognized whatever their file name.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        Optional[str]: The Arrow codec name, or None if uncompressed.
+    """
+    with open(file_path, "rb") as file:
+        head = file.read(max(len(magic) for magic in MAGIC_NUMBERS))
+    for magic, compression in MAGIC_NUMBERS.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_raw_input(file_path: str):
+    """
+    Open a raw file for parsing, decompressing on the fly when needed.
+
+    Args:
+        file_path (str): Path to the raw file.
+
+    Returns:
+        The path itself for uncompressed files, which the parsers read
+        fastest directly, otherwise a CountingReader over a streaming
+        decompressor. No uncompressed copy is written.
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        return file_path
+    return CountingReader(pa.input_stream(file_path, compression=compression))
+
+
+@contextmanager
+def raw_input(file_path: str) -> Iterator:
+    """
+    open_raw_input as a context manager that closes the decompressing
+    reader, if one was opened, when the block exits.
+
+    Args:
+        file_path (str): Path to the raw file.
+
+    Yields:
+        The path or CountingReader returned by open_raw_input.
+    """
+    source = open_raw_input(file_path)
+    try:
+        yield source
+    finally:
+        if not isinstance(source, str):
+            source.close()
@@ -1,22 +1,62 @@
 import pandas as pd
+from typing import Iterator, List, Optional, Tuple, Union
 #from src.extract.extract_transactions import extract_transactions
 from src.extract.extract_abalone import extract_abalone
+from src.extract.extract_abalone_files import extract_abalone_files
 from src.utils.logging_utils import setup_logger
 
 logger = setup_logger("extract_data", "extract_data.log")
 
 
-def extract_data() -> pd.DataFrame:
+def extract_data(
+    chunksize: Optional[int] = None,
+    typed: bool = False,
+    use_cache: bool = False,
+    source: Optional[str] = None,
+    workers: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple]] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     try:
         logger.info("Starting data extraction process")
 
         #transactions = extract_transactions()
-        abalone_df = extract_abalone()
+        if source is not None:
+            # A directory or glob of raw shards is parsed in parallel
+            if chunksize:
+                raise ValueError(
+                    "Chunked streaming is only supported for a single file"
+                )
+            abalone_df = extract_abalone_files(
+                source,
+                workers=workers,
+                typed=typed,
+                use_cache=use_cache,
+                columns=columns,
+                filters=filters,
+            )
+        else:
+            abalone_df = extract_abalone(
+                chunksize=chunksize,
+                typed=typed,
+                use_cache=use_cache,
+                workers=workers,
+                columns=columns,
+                filters=filters,
+            )
 
-        logger.info(
-            f"Data extraction completed successfully - "
-            f"Abalone: {abalone_df.shape}"
-        )
+        if chunksize:
+            # Chunks are parsed lazily as the caller iterates, so the
+            # per-chunk and total figures are logged by extract_abalone
+            logger.info(
+                f"Data extraction streaming - "
+                f"Abalone in chunks of {chunksize} rows"
+            )
+        else:
+            logger.info(
+                f"Data extraction completed successfully - "
+                f"Abalone: {abalone_df.shape}"
+            )
 
         return abalone_df
 
@@ -2,7 +2,24 @@ import os
 import logging
 import pandas as pd
 import timeit
-from src.utils.logging_utils import setup_logger, log_extract_success
+from typing import Iterator, List, Optional, Tuple, Union
+from src.extract.abalone_cache import read_abalone_csv_cached
+from src.extract.compressed_input import (
+    detect_compression,
+    raw_input,
+)
+from src.extract.extract_abalone_ranges import read_abalone_csv_ranges
+from src.extract.read_abalone_csv import (
+    read_abalone_csv,
+    abalone_read_csv_kwargs,
+    filter_abalone_chunk,
+)
+from src.utils.logging_utils import (
+    setup_logger,
+    log_extract_success,
+    log_extract_chunk_success,
+    log_compression_throughput,
+)
 
 # Define the file path for the customers CSV file
 FILE_PATH = os.path.join(
@@ -21,22 +38,148 @@ EXPECTED_PERFORMANCE = 0.0001
 
 TYPE = "ABALONE from CSV"
 
+TYPED_TYPE = "ABALONE from CSV (typed)"
+
+
+def extract_abalone(
+    chunksize: Optional[int] = None,
+    typed: bool = False,
+    use_cache: bool = False,
+    workers: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple]] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    # The cache stores the typed parse, so it is only keyed for that schema
+    if use_cache and not typed:
+        raise ValueError("The parsed input cache requires typed=True")
+    # Byte ranges are parsed independently, which only reproduces the
+    # serial result when dtypes are declared rather than inferred
+    if workers and workers > 1 and not typed:
+        raise ValueError("Parallel parsing of one file requires typed=True")
+    # A cache miss is parsed serially, so workers would be ignored
+    if use_cache and workers and workers > 1:
+        raise ValueError("The parsed input cache does not use workers")
+    # Projection and filters are expressed against the normalized schema
+    if (columns is not None or filters) and not typed:
+        raise ValueError("Column projection and filters require typed=True")
+
+    # Streaming mode hands back an iterator of fixed-size chunks so the
+    # raw file is never held in memory as a whole
+    if chunksize:
+        return stream_abalone(
+            chunksize, typed=typed, columns=columns, filters=filters
+        )
 
-def extract_abalone() -> pd.DataFrame:
     start_time = timeit.default_timer()
 
     try:
-        abalone_df = pd.read_csv(FILE_PATH)
+        compression = detect_compression(FILE_PATH)
+        source = None
+        if use_cache:
+            abalone_df = read_abalone_csv_cached(
+                FILE_PATH, columns=columns, filters=filters
+            )
+        elif workers and workers > 1 and compression is None:
+            abalone_df = read_abalone_csv_ranges(
+                FILE_PATH, workers, columns=columns, filters=filters
+            )
+        else:
+            if workers and workers > 1:
+                logger.info(
+                    f"{compression} input cannot be split into byte "
+                    "ranges, parsing serially"
+                )
+            with raw_input(FILE_PATH) as source:
+                if typed:
+                    abalone_df = read_abalone_csv(
+                        source, columns=columns, filters=filters
+                    )
+                else:
+                    abalone_df = pd.read_csv(source)
         extract_abalone_execution_time = timeit.default_timer() - start_time
         log_extract_success(
             logger,
-            TYPE,
+            TYPED_TYPE if typed else TYPE,
             abalone_df.shape,
             extract_abalone_execution_time,
             EXPECTED_PERFORMANCE,
         )
+        if compression and source is not None:
+            log_compression_throughput(
+                logger,
+                os.path.getsize(FILE_PATH),
+                source.bytes_read,
+                extract_abalone_execution_time,
+            )
         return abalone_df
     except Exception as e:
         logger.setLevel(logging.ERROR)
         logger.error(f"Error loading {FILE_PATH}: {e}")
         raise Exception(f"Failed to load CSV file: {FILE_PATH}")
+
+
+def stream_abalone(
+    chunksize: int,
+    typed: bool = False,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple]] = None,
+) -> Iterator[pd.DataFrame]:
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer: {chunksize}")
+
+    total_rows = 0
+    total_columns = 0
+    chunk_number = 0
+    # Only time spent parsing is counted, not time the consumer spends
+    # on each chunk between iterations
+    extract_abalone_execution_time = 0.0
+    extract_type = TYPED_TYPE if typed else TYPE
+    read_csv_kwargs = (
+        abalone_read_csv_kwargs(columns, filters) if typed else {}
+    )
+
+    try:
+        start_time = timeit.default_timer()
+        # The reader is closed when the stream finishes, fails or is
+        # closed by the consumer
+        with raw_input(FILE_PATH) as source:
+            reader = pd.read_csv(
+                source, chunksize=chunksize, **read_csv_kwargs
+            )
+            for chunk_number, chunk in enumerate(reader, start=1):
+                if typed:
+                    chunk = filter_abalone_chunk(chunk, columns, filters)
+                chunk_execution_time = timeit.default_timer() - start_time
+                extract_abalone_execution_time += chunk_execution_time
+                total_rows += chunk.shape[0]
+                total_columns = chunk.shape[1]
+                log_extract_chunk_success(
+                    logger,
+                    extract_type,
+                    chunk_number,
+                    chunk.shape,
+                    chunk_execution_time,
+                )
+                yield chunk
+                start_time = timeit.default_timer()
+    except Exception as e:
+        logger.setLevel(logging.ERROR)
+        logger.error(f"Error loading {FILE_PATH}: {e}")
+        raise Exception(f"Failed to load CSV file: {FILE_PATH}")
+
+    if total_rows:
+        log_extract_success(
+            logger,
+            extract_type,
+            (total_rows, total_columns),
+            extract_abalone_execution_time,
+            EXPECTED_PERFORMANCE,
+            chunks=chunk_number,
+        )
+        if not isinstance(source, str):
+            log_compression_throughput(
+                logger,
+                os.path.getsize(FILE_PATH),
+                source.bytes_read,
+                extract_abalone_execution_time,
+            )
@@ -0,0 +1,114 @@
+import os
+import glob
+import logging
+import timeit
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional
+from src.extract.abalone_cache import read_abalone_csv_cached
+from src.extract.compressed_input import raw_input
+from src.extract.read_abalone_csv import read_abalone_csv
+from src.utils.logging_utils import setup_logger, log_extract_success
+
+logger = setup_logger(__name__, "extract_data.log", level=logging.DEBUG)
+
+EXPECTED_PERFORMANCE = 0.0001
+
+TYPE = "ABALONE from CSV shards"
+
+RAW_FILE_PATTERN = "*.csv*"
+
+
+def resolve_raw_files(source: str) -> List[str]:
+    """
+    Resolve a directory or glob pattern to the raw files it names.
+
+    Args:
+        source (str): A directory of raw CSV shards or a glob pattern.
+
+    Returns:
+        List[str]: The matching file paths in sorted order.
+    """
+    if os.path.isdir(source):
+        source = os.path.join(source, RAW_FILE_PATTERN)
+    file_paths = sorted(
+        path for path in glob.glob(source) if os.path.isfile(path)
+    )
+    if not file_paths:
+        raise FileNotFoundError(f"No raw files found for {source}")
+    return file_paths
+
+
+def extract_abalone_files(
+    source: str,
+    workers: Optional[int] = None,
+    typed: bool = False,
+    use_cache: bool = False,
+    columns=None,
+    filters=None,
+) -> pd.DataFrame:
+    if use_cache and not typed:
+        raise ValueError("The parsed input cache requires typed=True")
+    if (columns is not None or filters) and not typed:
+        raise ValueError("Column projection and filters require typed=True")
+
+    file_paths = resolve_raw_files(source)
+    start_time = timeit.default_timer()
+
+    try:
+        # Each shard is parsed in its own process; map keeps the results
+        # in file order so the output does not depend on scheduling
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _read_raw_file,
+                    file_paths,
+                    repeat(typed),
+                    repeat(use_cache),
+                    repeat(columns),
+                    repeat(filters),
+                )
+            )
+    except Exception as e:
+        logger.setLevel(logging.ERROR)
+        logger.error(f"Error loading raw files for {source}: {e}")
+        raise Exception(f"Failed to load CSV files: {source}")
+
+    logger.setLevel(logging.INFO)
+    for file_path, (shard_df, shard_time) in zip(file_paths, results):
+        logger.info(
+            f"Extracted {len(shard_df)} rows from {file_path} "
+            f"in {shard_time} seconds"
+        )
+
+    abalone_df = pd.concat(
+        [shard_df for shard_df, _ in results], ignore_index=True
+    )
+    extract_execution_time = timeit.default_timer() - start_time
+    log_extract_success(
+        logger,
+        TYPE,
+        abalone_df.shape,
+        extract_execution_time,
+        EXPECTED_PERFORMANCE,
+    )
+    return abalone_df
+
+
+def _read_raw_file(
+    file_path: str, typed: bool, use_cache: bool, columns, filters
+):
+    start_time = timeit.default_timer()
+    if use_cache:
+        shard_df = read_abalone_csv_cached(
+            file_path, columns=columns, filters=filters
+        )
+    elif typed:
+        shard_df = read_abalone_csv(
+            file_path, columns=columns, filters=filters
+        )
+    else:
+        with raw_input(file_path) as source:
+            shard_df = pd.read_csv(source)
+    return shard_df, timeit.default_timer() - start_time
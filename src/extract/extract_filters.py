@@ -0,0 +1,228 @@
+import numbers
+import operator
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from functools import reduce
+from typing import List, Optional, Sequence, Tuple
+
+# A filter spec is a list of (column, op, value) tuples that must all hold,
+# in the same form as the pandas/pyarrow read_parquet filters
+COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+MEMBERSHIP_OPERATORS = ("in", "not in")
+
+SQL_OPERATORS = {
+    "==": "=",
+    "!=": "<>",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+    "in": "IN",
+    "not in": "NOT IN",
+}
+
+
+def validate_filters(filters: Optional[Sequence[Tuple]]) -> List[Tuple]:
+    """
+    Check a filter spec and return it as a list of (column, op, value).
+
+    Args:
+        filters: Sequence of (column, op, value) tuples, or None.
+
+    Returns:
+        List[Tuple]: The validated filters (empty when none are given).
+    """
+    if not filters:
+        return []
+    validated = []
+    for spec in filters:
+        if len(spec) != 3:
+            raise ValueError(f"Filters must be (column, op, value): {spec}")
+        column, op, value = spec
+        if op not in COMPARISON_OPERATORS and op not in MEMBERSHIP_OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        if op in MEMBERSHIP_OPERATORS and (
+            isinstance(value, str) or not len(value)
+        ):
+            raise ValueError(f"'{op}' filters need a list of values: {spec}")
+        validated.append((column, op, value))
+    return validated
+
+
+def required_columns(
+    columns: Optional[Sequence[str]], filters: Optional[Sequence[Tuple]]
+) -> Optional[List[str]]:
+    """
+    Columns a reader has to materialize to project and filter.
+
+    Args:
+        columns: Requested output columns, or None for all columns.
+        filters: Filter spec.
+
+    Returns:
+        Optional[List[str]]: Output columns followed by any extra filter
+        columns, or None when every column is requested.
+    """
+    if columns is None:
+        return None
+    extra = [
+        column
+        for column, _, _ in validate_filters(filters)
+        if column not in columns
+    ]
+    return list(columns) + list(dict.fromkeys(extra))
+
+
+def filter_arrow_table(
+    table: pa.Table,
+    columns: Optional[Sequence[str]],
+    filters: Optional[Sequence[Tuple]],
+) -> pa.Table:
+    """
+    Apply a filter spec and projection to an Arrow table before it is
+    converted to pandas.
+
+    Args:
+        table (pa.Table): Table holding the required columns.
+        columns: Output columns, or None to keep them all.
+        filters: Filter spec.
+
+    Returns:
+        pa.Table: The filtered and projected table.
+    """
+    expressions = [
+        _arrow_expression(column, op, value, table.schema.field(column).type)
+        for column, op, value in validate_filters(filters)
+    ]
+    if expressions:
+        table = table.filter(reduce(operator.and_, expressions))
+    if columns is not None:
+        table = table.select(list(columns))
+    return table
+
+
+def filter_dataframe(
+    df: pd.DataFrame,
+    columns: Optional[Sequence[str]],
+    filters: Optional[Sequence[Tuple]],
+) -> pd.DataFrame:
+    """
+    Apply a filter spec and projection to a pandas DataFrame.
+
+    Args:
+        df (pd.DataFrame): Frame holding the required columns.
+        columns: Output columns, or None to keep them all.
+        filters: Filter spec.
+
+    Returns:
+        pd.DataFrame: The filtered and projected frame.
+    """
+    validated = validate_filters(filters)
+    if validated:
+        mask = reduce(
+            operator.and_,
+            (
+                _pandas_mask(df, column, op, value)
+                for column, op, value in validated
+            ),
+        )
+        df = df[mask]
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def build_projected_query(
+    query: str,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Tuple]] = None,
+) -> Tuple[str, dict]:
+    """
+    Wrap a source query so the database does the projection and filtering.
+
+    Args:
+        query (str): The source query.
+        columns: Output columns, or None for all columns.
+        filters: Filter spec.
+
+    Returns:
+        Tuple[str, dict]: Query text with bound :filter_<n> parameters and
+        the parameter values, as plain Python values so the database
+        compares them at the column's own type.
+    """
+    select_list = (
+        ", ".join(f'"{column}"' for column in columns) if columns else "*"
+    )
+    conditions = []
+    params = {}
+    for n, (column, op, value) in enumerate(validate_filters(filters)):
+        if op in MEMBERSHIP_OPERATORS:
+            names = [f"filter_{n}_{i}" for i in range(len(value))]
+            params.update(zip(names, map(_python_value, value)))
+            placeholder = f"({', '.join(f':{name}' for name in names)})"
+        else:
+            params[f"filter_{n}"] = _python_value(value)
+            placeholder = f":filter_{n}"
+        conditions.append(f'"{column}" {SQL_OPERATORS[op]} {placeholder}')
+
+    projected_query = (
+        f"SELECT {select_list} FROM ({query.strip().rstrip(';')}) "
+        "AS projected_source"
+    )
+    if conditions:
+        projected_query += f" WHERE {' AND '.join(conditions)}"
+    return projected_query, params
+
+
+# Filter values are compared at the precision of the column. Arrow would
+# otherwise upcast a float32 column to double to meet a Python float while
+# NumPy compares at float32, so the same filter kept different rows on the
+# Arrow and pandas read paths
+def _arrow_expression(column, op, value, column_type):
+    field = pc.field(column)
+    if op == "in":
+        return field.isin(_arrow_values(value, column_type))
+    if op == "not in":
+        return ~field.isin(_arrow_values(value, column_type))
+    if pa.types.is_floating(column_type) and _is_number(value):
+        value = pa.scalar(value, type=column_type)
+    return COMPARISON_OPERATORS[op](field, value)
+
+
+def _arrow_values(values, column_type):
+    if pa.types.is_floating(column_type) and all(map(_is_number, values)):
+        return pa.array(list(values), type=column_type)
+    return list(values)
+
+
+def _pandas_mask(df, column, op, value):
+    dtype = df[column].dtype
+    if op in MEMBERSHIP_OPERATORS:
+        values = [_pandas_value(item, dtype) for item in value]
+        mask = df[column].isin(values)
+        return ~mask if op == "not in" else mask
+    return COMPARISON_OPERATORS[op](df[column], _pandas_value(value, dtype))
+
+
+def _pandas_value(value, dtype):
+    if pd.api.types.is_float_dtype(dtype) and _is_number(value):
+        return np.dtype(dtype).type(value)
+    return value
+
+
+def _python_value(value):
+    # NumPy scalars are not adapted by every database driver
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
@@ -0,0 +1,144 @@
+import os
+import json
+import hashlib
+import logging
+import pandas as pd
+from datetime import datetime
+from sqlalchemy import text
+from src.extract.extract_query import execute_extract_query
+from src.utils.logging_utils import setup_logger
+
+# High-water marks of incremental extractions, one per source query
+STATE_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "data",
+    "state",
+    "watermarks.json",
+)
+
+logger = setup_logger(__name__, "database_query.log", level=logging.DEBUG)
+
+
+def watermark_key(query: str) -> str:
+    """
+    Default state key for a source query: a digest of its text.
+
+    Args:
+        query (str): The source query.
+
+    Returns:
+        str: Short hex digest identifying the query.
+    """
+    return hashlib.sha256(" ".join(query.split()).encode()).hexdigest()[:16]
+
+
+def load_watermark(key: str, state_path: str = STATE_PATH):
+    """
+    Load the stored high-water mark for a source query.
+
+    Args:
+        key (str): State key of the source query.
+        state_path (str): Path to the JSON state store.
+
+    Returns:
+        The stored watermark (int, float or pd.Timestamp), or None if
+        the query has not been extracted yet.
+    """
+    entry = _read_state(state_path).get(key)
+    if entry is None:
+        return None
+    if entry["type"] == "timestamp":
+        return pd.Timestamp(entry["value"])
+    return entry["value"]
+
+
+def save_watermark(key: str, value, state_path: str = STATE_PATH) -> None:
+    """
+    Store the high-water mark for a source query.
+
+    Args:
+        key (str): State key of the source query.
+        value: The new watermark (a number or a timestamp).
+        state_path (str): Path to the JSON state store.
+    """
+    if isinstance(value, datetime):
+        entry = {"type": "timestamp", "value": value.isoformat()}
+    else:
+        # NumPy scalars (e.g. from Series.max) are not JSON serialisable
+        if hasattr(value, "item"):
+            value = value.item()
+        entry = {"type": "number", "value": value}
+
+    state = _read_state(state_path)
+    state[key] = entry
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    # Replace the state file atomically so a crash never truncates it
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def build_incremental_query(query: str, watermark_column: str, watermark):
+    """
+    Rewrite a source query to only return rows past the watermark.
+
+    Args:
+        query (str): The source query.
+        watermark_column (str): Monotonic column (id or timestamp).
+        watermark: The stored watermark, or None for a full read.
+
+    Returns:
+        A SQLAlchemy text clause; the watermark is bound as :watermark.
+    """
+    source = query.strip().rstrip(";")
+    if watermark is None:
+        return text(source)
+    return text(
+        f"SELECT * FROM ({source}) AS incremental_source "
+        f'WHERE "{watermark_column}" > :watermark '
+        f'ORDER BY "{watermark_column}"'
+    )
+
+
+def extract_incremental(
+    query: str,
+    connection,
+    watermark_column: str,
+    key: str = None,
+    state_path: str = STATE_PATH,
+    commit_watermark: bool = True,
+) -> pd.DataFrame:
+    key = key or watermark_key(query)
+    watermark = load_watermark(key, state_path)
+
+    incremental_query = build_incremental_query(
+        query, watermark_column, watermark
+    )
+    params = None if watermark is None else {"watermark": watermark}
+    new_rows = execute_extract_query(incremental_query, connection, params)
+
+    logger.setLevel(logging.INFO)
+    if watermark is None:
+        logger.info(f"Full extraction for {key}: {len(new_rows)} rows")
+    else:
+        logger.info(
+            f"Incremental extraction for {key}: {len(new_rows)} new rows "
+            f"past {watermark_column} > {watermark}"
+        )
+
+    # Only move the watermark forward; callers that load the rows in a
+    # separate step can commit it afterwards with save_watermark
+    if commit_watermark and not new_rows.empty:
+        save_watermark(key, new_rows[watermark_column].max(), state_path)
+
+    return new_rows
+
+
+def _read_state(state_path: str) -> dict:
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path, "r") as file:
+        return json.load(file)
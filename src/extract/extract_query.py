@@ -1,17 +1,155 @@
+import io
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 import logging
+import timeit
+from typing import Iterator
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from src.extract.extract_filters import build_projected_query
 from src.utils.logging_utils import setup_logger
 from src.utils.db_utils import QueryExecutionError
 
 # Configure the logger
 logger = setup_logger(__name__, "database_query.log", level=logging.DEBUG)
 
+DEFAULT_BATCH_SIZE = 10000
 
-def execute_extract_query(query, connection):
+
+def execute_extract_query(query, connection, params=None):
     try:
-        return pd.read_sql_query(query, connection)
+        if params is None:
+            return pd.read_sql_query(query, connection)
+        return pd.read_sql_query(query, connection, params=params)
     except pd.errors.DatabaseError as e:
         logger.setLevel(logging.ERROR)
         logger.error(f"Failed to execute query: {e}")
         logger.error(f"The query that failed was: {query}")
         raise QueryExecutionError(f"Failed to execute query: {e}")
+
+
+def execute_projected_query(query, connection, columns=None, filters=None):
+    # The database applies the projection and WHERE clause, so unused
+    # columns and rows never leave the server
+    projected_query, params = build_projected_query(query, columns, filters)
+    return execute_extract_query(text(projected_query), connection, params)
+
+
+def stream_extract_query(
+    query, connection, batch_size=DEFAULT_BATCH_SIZE
+) -> Iterator[pd.DataFrame]:
+    if batch_size < 1:
+        raise ValueError(
+            f"batch_size must be a positive integer: {batch_size}"
+        )
+
+    total_rows = 0
+    total_time = 0.0
+    batch_number = 0
+
+    try:
+        # stream_results makes SQLAlchemy fetch through a named server-side
+        # cursor on PostgreSQL, holding at most one batch client-side
+        streaming_connection = connection.execution_options(
+            stream_results=True, max_row_buffer=batch_size
+        )
+        start_time = timeit.default_timer()
+        batches = pd.read_sql_query(
+            query, streaming_connection, chunksize=batch_size
+        )
+        for batch_number, batch in enumerate(batches, start=1):
+            batch_time = timeit.default_timer() - start_time
+            total_time += batch_time
+            total_rows += len(batch)
+            logger.setLevel(logging.INFO)
+            logger.info(
+                f"Fetched batch {batch_number}: {len(batch)} rows "
+                f"in {batch_time} seconds"
+            )
+            yield batch
+            start_time = timeit.default_timer()
+    except (pd.errors.DatabaseError, SQLAlchemyError) as e:
+        logger.setLevel(logging.ERROR)
+        logger.error(f"Failed to execute query: {e}")
+        logger.error(f"The query that failed was: {query}")
+        raise QueryExecutionError(f"Failed to execute query: {e}")
+
+    logger.setLevel(logging.INFO)
+    logger.info(
+        f"Streamed {total_rows} rows in {batch_number} batches "
+        f"in {total_time} seconds"
+    )
+
+
+def copy_extract_query(query, connection) -> pd.DataFrame:
+    # COPY hands the whole result over as one CSV byte stream which the
+    # Arrow parser consumes directly - no per-row Python objects are built
+    copy_statement = (
+        f"COPY ({query.strip().rstrip(';')}) "
+        "TO STDOUT WITH (FORMAT csv, HEADER true)"
+    )
+    dbapi_error = connection.dialect.loaded_dbapi.Error
+
+    try:
+        start_time = timeit.default_timer()
+        cursor = connection.connection.driver_connection.cursor()
+        try:
+            if hasattr(cursor, "copy"):
+                # psycopg 3 streams COPY output block by block
+                with cursor.copy(copy_statement) as copy:
+                    table = _parse_copy_csv(
+                        io.BufferedReader(_CopyStream(copy))
+                    )
+            else:
+                # psycopg2 can only COPY into a file object
+                buffer = io.BytesIO()
+                cursor.copy_expert(copy_statement, buffer)
+                buffer.seek(0)
+                table = _parse_copy_csv(buffer)
+        finally:
+            cursor.close()
+        execution_time = timeit.default_timer() - start_time
+    except (dbapi_error, SQLAlchemyError, pa.ArrowInvalid) as e:
+        logger.setLevel(logging.ERROR)
+        logger.error(f"Failed to execute query: {e}")
+        logger.error(f"The query that failed was: {query}")
+        raise QueryExecutionError(f"Failed to execute query: {e}")
+
+    logger.setLevel(logging.INFO)
+    logger.info(
+        f"Copied {table.num_rows} rows and {table.num_columns} columns "
+        f"in {execution_time} seconds"
+    )
+    return table.to_pandas()
+
+
+def _parse_copy_csv(stream) -> pa.Table:
+    # PostgreSQL writes NULL as an unquoted empty field
+    return pv.read_csv(
+        stream,
+        convert_options=pv.ConvertOptions(strings_can_be_null=True),
+    )
+
+
+class _CopyStream(io.RawIOBase):
+    """Read-only file object over the blocks of a psycopg 3 COPY."""
+
+    def __init__(self, copy):
+        self._copy = copy
+        self._block = memoryview(b"")
+        self._exhausted = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self._block and not self._exhausted:
+            self._block = memoryview(self._copy.read())
+            self._exhausted = not self._block
+        if self._exhausted:
+            return 0
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
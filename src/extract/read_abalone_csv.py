@@ -0,0 +1,179 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+from src.extract.compressed_input import raw_input
+from src.extract.extract_filters import (
+    filter_arrow_table,
+    filter_dataframe,
+    required_columns,
+)
+from src.utils.abalone_schema import SEX_CATEGORIES
+
+# Normalized column names - the raw header carries leading spaces
+# (" Length") which are dropped here
+ABALONE_COLUMNS = [
+    "Sex",
+    "Length",
+    "Diameter",
+    "Height",
+    "Whole_weight",
+    "Shucked_weight",
+    "Viscera_weight",
+    "Shell_weight",
+    "Class",
+]
+MEASUREMENT_COLUMNS = ABALONE_COLUMNS[1:8]
+
+CLASS_TRUE_VALUES = ["positive"]
+CLASS_FALSE_VALUES = ["negative"]
+
+# Declared pandas dtypes of a typed Abalone frame
+ABALONE_SCHEMA = {
+    "Sex": pd.CategoricalDtype(SEX_CATEGORIES),
+    **{col: "float32" for col in MEASUREMENT_COLUMNS},
+    "Class": "int8",
+}
+
+# Bump whenever the declared schema or the parsing rules change so that
+# anything derived from a typed parse (e.g. cached frames) is rebuilt
+SCHEMA_VERSION = 1
+
+# Arrow parses the categorical as int32-indexed dictionary and the class
+# labels as booleans; apply_abalone_schema narrows both afterwards
+_ARROW_COLUMN_TYPES = {
+    "Sex": pa.dictionary(pa.int32(), pa.string()),
+    **{col: pa.float32() for col in MEASUREMENT_COLUMNS},
+    "Class": pa.bool_(),
+}
+
+
+def read_abalone_csv(
+    file_path,
+    header: bool = True,
+    use_threads: bool = True,
+    columns=None,
+    filters=None,
+) -> pd.DataFrame:
+    """
+    Read a raw Abalone CSV with the pyarrow CSV engine and the declared
+    Abalone schema instead of pandas type inference.
+
+    Args:
+        file_path: Path to (or binary file object of) a raw Abalone CSV.
+            Compressed files are decompressed while parsing.
+        header (bool): Whether the input starts with a header line.
+        use_threads (bool): Whether Arrow may parse on multiple threads.
+        columns: Columns to return, or None for all. Other columns are
+            never converted.
+        filters: (column, op, value) filters applied to the Arrow table
+            before it becomes a DataFrame.
+
+    Returns:
+        pd.DataFrame: Frame with float32 measurements, a categorical
+        'Sex', an int8 'Class' and normalized column names.
+    """
+    if isinstance(file_path, str):
+        # Paths are opened (and decompressors closed) here; file objects
+        # stay owned by the caller
+        with raw_input(file_path) as source:
+            return _read_abalone_csv(
+                source, header, use_threads, columns, filters
+            )
+    return _read_abalone_csv(file_path, header, use_threads, columns, filters)
+
+
+def _read_abalone_csv(source, header, use_threads, columns, filters):
+    table = pv.read_csv(
+        source,
+        read_options=pv.ReadOptions(
+            column_names=ABALONE_COLUMNS,
+            skip_rows=1 if header else 0,
+            use_threads=use_threads,
+        ),
+        convert_options=pv.ConvertOptions(
+            column_types=_ARROW_COLUMN_TYPES,
+            true_values=CLASS_TRUE_VALUES,
+            false_values=CLASS_FALSE_VALUES,
+            include_columns=required_columns(columns, filters) or [],
+        ),
+    )
+    if "Class" in table.column_names:
+        # Narrow before filtering so filters see the declared 0/1 labels
+        table = table.set_column(
+            table.column_names.index("Class"),
+            "Class",
+            pc.cast(table["Class"], pa.int8()),
+        )
+    table = filter_arrow_table(table, columns, filters)
+    return apply_abalone_schema(table.to_pandas())
+
+
+def abalone_read_csv_kwargs(columns=None, filters=None) -> dict:
+    """
+    Keyword arguments giving pandas.read_csv the declared Abalone schema,
+    for readers the pyarrow engine does not support (e.g. chunksize).
+    Filters are not applied by pandas.read_csv; use
+    filter_abalone_chunk on each parsed chunk.
+
+    Args:
+        columns: Columns to return, or None for all.
+        filters: (column, op, value) filters that will be applied.
+
+    Returns:
+        dict: Keyword arguments for pandas.read_csv.
+    """
+    return {
+        "usecols": required_columns(columns, filters),
+        "header": 0,
+        "names": ABALONE_COLUMNS,
+        "dtype": {
+            **{col: "float32" for col in MEASUREMENT_COLUMNS},
+            "Sex": ABALONE_SCHEMA["Sex"],
+            "Class": "bool",
+        },
+        "true_values": CLASS_TRUE_VALUES,
+        "false_values": CLASS_FALSE_VALUES,
+    }
+
+
+def apply_abalone_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast a parsed Abalone frame to the declared schema.
+
+    Args:
+        df (pd.DataFrame): Frame with (a subset of) the Abalone columns.
+
+    Returns:
+        pd.DataFrame: The frame with the declared dtypes.
+    """
+    df = df.astype(
+        {
+            col: dtype
+            for col, dtype in ABALONE_SCHEMA.items()
+            if col in df and col != "Sex"
+        }
+    )
+    if "Sex" in df:
+        # Recode onto the fixed vocabulary; astype alone keeps the order in
+        # which the parser happened to meet the categories
+        df["Sex"] = pd.Categorical(df["Sex"], categories=SEX_CATEGORIES)
+    return df
+
+
+def filter_abalone_chunk(
+    chunk: pd.DataFrame, columns=None, filters=None
+) -> pd.DataFrame:
+    """
+    Apply the declared schema, filters and projection to a chunk parsed
+    with abalone_read_csv_kwargs.
+
+    Args:
+        chunk (pd.DataFrame): Chunk parsed by pandas.read_csv.
+        columns: Columns to return, or None for all.
+        filters: (column, op, value) filters.
+
+    Returns:
+        pd.DataFrame: The typed, filtered and projected chunk.
+    """
+    return filter_dataframe(apply_abalone_schema(chunk), columns, filters)
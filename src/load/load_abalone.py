@@ -2,6 +2,10 @@ import pandas as pd
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
 import os
+from src.transform.version_set import VersionSet
+from src.utils.logging_utils import setup_logger
+
+logger = setup_logger(__name__, "load_data.log")
 
 def load_abalone_to_db(df: pd.DataFrame):
     
@@ -17,5 +21,37 @@ def load_abalone_to_db(df: pd.DataFrame):
     # Create SQLAlchemy engine
     db_engine = create_engine(f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}")
 
-    # Write to PostgreSQL
-    df.to_sql("atapoor_capstone_project", db_engine, schema="de_2506_a", if_exists="replace", index=False)
+    if isinstance(df, pd.DataFrame):
+        # Write to PostgreSQL
+        df.to_sql(
+            "atapoor_capstone_project",
+            db_engine,
+            schema="de_2506_a",
+            if_exists="replace",
+            index=False,
+        )
+        return
+
+    # A stream of (name, frame) versions, or a VersionSet, is loaded one
+    # version at a time: the first replaces the table, the rest append.
+    # All of them are written in one transaction, so a failure part way
+    # through (including one while resampling a streamed version) rolls
+    # back to the previous table instead of leaving it partially written;
+    # PostgreSQL also rolls back the DROP/CREATE of the replace
+    versions = df.items() if isinstance(df, VersionSet) else df
+    try:
+        with db_engine.begin() as connection:
+            if_exists = "replace"
+            for name, version_df in versions:
+                version_df.to_sql(
+                    "atapoor_capstone_project",
+                    connection,
+                    schema="de_2506_a",
+                    if_exists=if_exists,
+                    index=False,
+                )
+                logger.info(f"Loaded {name} ({len(version_df)} rows)")
+                if_exists = "append"
+    except Exception as e:
+        logger.error(f"Loading data versions failed, rolled back: {e}")
+        raise
@@ -1,6 +1,7 @@
 
 import os
 import pandas as pd
+from src.transform.version_set import VersionSet
 
 def write_data_versions_to_csv(data_dic: dict[str, pd.DataFrame]):
     FILE_PATH = os.path.join(
@@ -10,5 +11,11 @@ def write_data_versions_to_csv(data_dic: dict[str, pd.DataFrame]):
     "data",
     "data_versions"
     )
-    for name, df in data_dic.items():
+    # Also takes a stream of (name, frame) pairs, written as they arrive
+    versions = (
+        data_dic.items()
+        if isinstance(data_dic, (dict, VersionSet))
+        else data_dic
+    )
+    for name, df in versions:
         df.to_csv(f"{FILE_PATH}/{name}.csv", index=False)
\ No newline at end of file
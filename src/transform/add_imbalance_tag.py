@@ -1,11 +1,56 @@
 
 import pandas as pd
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from src.transform.version_set import (
+    VersionSet,
+    label_values,
+    sorted_labels,
+)
+
+def add_tag_to_data_versions(
+    data_dic: dict[str, pd.DataFrame],
+    tags: Optional[Dict[str, int]] = None,
+    labels: Optional[Dict[str, Dict[str, object]]] = None,
+) -> dict[str, pd.DataFrame]:
+    # tags maps each version name to its IR, e.g. from the resampling grid;
+    # without them versions are tagged 5, 10, 15, ... in order. labels
+    # maps 'Kind', 'Seed' or 'Replicate' to each version's value
+    if isinstance(data_dic, VersionSet):
+        # Tags are kept on the set and added when a version is built
+        data_dic.tags = tags or data_dic.tags or {
+            name: 5 * (position + 1) for position, name in enumerate(data_dic)
+        }
+        if labels:
+            data_dic.labels = dict(labels)
+        return data_dic
+    if not isinstance(data_dic, dict):
+        # A stream of (name, frame) versions is tagged lazily
+        return iter_tagged_versions(data_dic, tags, labels)
 
-def add_tag_to_data_versions(data_dic : dict[str, pd.DataFrame] ) -> dict[str, pd.DataFrame]:
     tag = 5
     
     for name, df in data_dic.items():
         
-        df["IR"] = tag
+        _add_labels(df, name, labels)
+        df["IR"] = tags[name] if tags else tag
         tag += 5
-    return data_dic
\ No newline at end of file
+    return data_dic
+
+
+def iter_tagged_versions(
+    versions: Iterable[Tuple[str, pd.DataFrame]],
+    tags: Optional[Dict[str, int]] = None,
+    labels: Optional[Dict[str, Dict[str, object]]] = None,
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    tag = 5
+    for name, df in versions:
+        _add_labels(df, name, labels)
+        df["IR"] = tags[name] if tags else tag
+        yield name, df
+        tag += 5
+
+
+def _add_labels(df, name, labels):
+    # Label columns go before 'IR', as in merge_abalone_df
+    for column, values in sorted_labels(labels or {}).items():
+        df[column] = label_values(column, values, name, len(df))
@@ -0,0 +1,329 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype
+from src.transform.neighbour_search import kneighbors
+
+BORDERLINE_KINDS = ("borderline-1", "borderline-2")
+
+
+def fit_borderline_neighbours(
+    X: pd.DataFrame,
+    y: pd.Series,
+    kind: str = "borderline-1",
+    k_neighbors: int = 5,
+    m_neighbors: int = 10,
+    dtype=np.float64,
+    algorithm: str = "auto",
+) -> dict:
+    """
+    Run the BorderlineSMOTE neighbour searches once for an input.
+
+    The m-neighbour search that finds the minority samples "in danger" and
+    the k-neighbour search among which they are interpolated depend only
+    on the input, not on the requested minority ratio, so one fit serves
+    every ratio version.
+
+    Args:
+        X (pd.DataFrame): Predictors.
+        y (pd.Series): Binary target.
+        kind (str): 'borderline-1' or 'borderline-2'.
+        k_neighbors (int): Neighbours used to build synthetic samples.
+        m_neighbors (int): Neighbours used to find the danger samples.
+        dtype: Float dtype of the neighbour search and the synthetic
+            samples. float32 halves their memory; float columns of the
+            resampled frames then come out as float32 too.
+        algorithm (str): Neighbour search backend, see
+            neighbour_search.NEIGHBOUR_BACKENDS.
+
+    Returns:
+        dict: The danger samples, their neighbour indices and what is
+        needed to turn them into resampled frames.
+    """
+    if kind not in BORDERLINE_KINDS:
+        raise ValueError(
+            f"kind must be one of {BORDERLINE_KINDS}, got '{kind}'"
+        )
+    y = pd.Series(y, name=y.name or "target")
+    X_values = X.to_numpy(dtype=dtype)
+    y_values = y.to_numpy()
+
+    classes, counts = np.unique(y_values, return_counts=True)
+    if len(classes) != 2:
+        raise ValueError(
+            f"BorderlineSMOTE ratios need a binary target, got {classes}"
+        )
+    minority_class = classes[np.argmin(counts)]
+    minority_indices = np.flatnonzero(y_values == minority_class)
+    X_minority = X_values[minority_indices]
+
+    # A minority sample is in danger when at least half, but not all, of
+    # its m nearest neighbours belong to the majority class
+    m_indices = kneighbors(
+        X_values, X_minority, m_neighbors + 1, algorithm=algorithm
+    )
+    n_majority_neighbours = (
+        y_values[m_indices[:, 1:]] != minority_class
+    ).sum(axis=1)
+    danger_mask = (n_majority_neighbours >= m_neighbors / 2) & (
+        n_majority_neighbours < m_neighbors
+    )
+
+    graph = {
+        "columns": X.columns,
+        "dtypes": {
+            col: np.dtype(dtype) if is_float_dtype(col_dtype) else col_dtype
+            for col, col_dtype in X.dtypes.items()
+        },
+        "target_name": y.name,
+        "X": X_values,
+        "y": y_values,
+        "kind": kind,
+        "minority_class": minority_class,
+        "n_minority": int(counts.min()),
+        "n_majority": int(counts.max()),
+        "danger": X_minority[danger_mask],
+        "sample_from": None,
+        "sample_from_labels": None,
+        "neighbours": np.empty((0, k_neighbors), dtype=np.intp),
+    }
+    if not danger_mask.any():
+        return graph
+
+    # borderline-1 interpolates towards minority neighbours only,
+    # borderline-2 towards any neighbour
+    if kind == "borderline-1":
+        sample_from = X_minority
+    else:
+        sample_from = X_values
+        graph["sample_from_labels"] = y_values
+    graph["sample_from"] = sample_from
+    graph["neighbours"] = kneighbors(
+        sample_from, graph["danger"], k_neighbors + 1, algorithm=algorithm
+    )[:, 1:]
+    return graph
+
+
+def synthetic_sample_count(graph: dict, target_minority_ratio: float) -> int:
+    """
+    Number of synthetic samples needed to reach a minority/majority ratio.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        target_minority_ratio (float): Requested minority/majority ratio.
+
+    Returns:
+        int: Synthetic minority samples to generate; 0 when the minority
+        share already reaches the ratio, so the data is kept unchanged.
+    """
+    n_samples = int(
+        graph["n_majority"] * target_minority_ratio - graph["n_minority"]
+    )
+    return max(n_samples, 0)
+
+
+def sample_borderline(
+    graph: dict, n_samples: int, random_state: int = 42
+) -> np.ndarray:
+    """
+    Interpolate synthetic minority samples from a fitted neighbour graph.
+
+    Draws the same seeds, neighbours and gaps as imblearn's
+    BorderlineSMOTE for the same random_state.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        n_samples (int): Number of synthetic samples.
+        random_state (int): Seed for the seed/neighbour/gap draws.
+
+    Returns:
+        np.ndarray: Synthetic samples, one row per sample.
+    """
+    neighbours = graph["neighbours"]
+    X = graph["X"]
+    if not len(neighbours) or not n_samples:
+        return np.empty((0, X.shape[1]), dtype=X.dtype)
+
+    # All seed/neighbour pairs and gaps are drawn up front as arrays and
+    # the whole synthetic block is interpolated in place, in X's dtype
+    rng = np.random.RandomState(random_state)
+    sample_indices = rng.randint(low=0, high=neighbours.size, size=n_samples)
+    steps = rng.uniform(size=n_samples)[:, np.newaxis].astype(X.dtype)
+
+    # imblearn draws the borderline-2 gaps from a fresh generator with the
+    # same seed
+    def draw_gaps(n_pairs):
+        return np.random.RandomState(random_state).uniform(
+            low=0.0, high=0.5, size=(n_pairs, 1)
+        )
+
+    return _interpolate(graph, sample_indices, steps, draw_gaps)
+
+
+def sample_borderline_replicates(
+    graph: dict, n_samples: int, n_replicates: int, random_state: int = 42
+) -> np.ndarray:
+    """
+    Interpolate several independent sets of synthetic minority samples.
+
+    The seed/neighbour pairs, steps and gaps of all replicates are drawn
+    as one batch from a single generator and interpolated together, so
+    extra replicates only cost the draws and the interpolation.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        n_samples (int): Number of synthetic samples per replicate.
+        n_replicates (int): Number of replicates.
+        random_state (int): Seed of the batched draws.
+
+    Returns:
+        np.ndarray: Synthetic samples, shape
+        (n_replicates, n_samples, n_features).
+    """
+    neighbours = graph["neighbours"]
+    X = graph["X"]
+    if not len(neighbours) or not n_samples:
+        return np.empty((n_replicates, 0, X.shape[1]), dtype=X.dtype)
+
+    rng = np.random.RandomState(random_state)
+    shape = (n_replicates, n_samples)
+    sample_indices = rng.randint(low=0, high=neighbours.size, size=shape)
+    steps = rng.uniform(size=shape)[..., np.newaxis].astype(X.dtype)
+
+    def draw_gaps(n_pairs):
+        return rng.uniform(low=0.0, high=0.5, size=(n_pairs, 1))
+
+    return _interpolate(graph, sample_indices, steps, draw_gaps)
+
+
+def _interpolate(graph, sample_indices, steps, draw_gaps):
+    # sample_indices index the flattened neighbour table; steps has the
+    # same shape plus a trailing axis of one
+    neighbours = graph["neighbours"]
+    rows = sample_indices // neighbours.shape[1]
+    cols = sample_indices % neighbours.shape[1]
+
+    neighbour_rows = neighbours[rows, cols]
+    seeds = graph["danger"][rows]
+    synthetic = graph["sample_from"][neighbour_rows]
+    synthetic -= seeds
+    if graph["sample_from_labels"] is not None:
+        # borderline-2 stays closer to the seed when the neighbour is from
+        # the majority class
+        majority_pairs = (
+            graph["sample_from_labels"][neighbour_rows]
+            != graph["minority_class"]
+        )
+        synthetic[majority_pairs] *= draw_gaps(majority_pairs.sum())
+    synthetic *= steps
+    synthetic += seeds
+    return synthetic
+
+
+def resample_from_neighbours(
+    graph: dict, target_minority_ratio: float, random_state: int = 42
+) -> pd.DataFrame:
+    """
+    Build one resampled version from a fitted neighbour graph.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        target_minority_ratio (float): Requested minority/majority ratio.
+        random_state (int): Seed for the synthetic samples.
+
+    Returns:
+        pd.DataFrame: Original rows followed by the synthetic minority
+        rows, in the layout of resample_with_borderline_smote.
+    """
+    n_samples = synthetic_sample_count(graph, target_minority_ratio)
+    X_new = sample_borderline(graph, n_samples, random_state)
+    return resampled_frame(graph, X_new)
+
+
+def nested_synthetic_pool(
+    graph: dict, target_minority_ratios, random_state: int = 42
+) -> tuple:
+    """
+    Draw one pool of synthetic samples that serves nested ratio versions.
+
+    The pool is generated once for the largest ratio; the version for
+    each ratio takes a prefix of it, so every version is a superset of
+    all versions with a lower ratio.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        target_minority_ratios: Requested minority/majority ratios.
+        random_state (int): Seed for the synthetic pool.
+
+    Returns:
+        tuple: The pool and the prefix length for each ratio.
+    """
+    n_samples = [
+        synthetic_sample_count(graph, ratio)
+        for ratio in target_minority_ratios
+    ]
+    return sample_borderline(graph, max(n_samples), random_state), n_samples
+
+
+def resample_nested_from_neighbours(
+    graph: dict, target_minority_ratios, random_state: int = 42
+) -> list:
+    """
+    Build nested ratio versions from one pool of synthetic samples.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        target_minority_ratios: Requested minority/majority ratios.
+        random_state (int): Seed for the synthetic pool.
+
+    Returns:
+        list: One resampled frame per ratio, in the order given.
+    """
+    pool, n_samples = nested_synthetic_pool(
+        graph, target_minority_ratios, random_state
+    )
+    return [resampled_frame(graph, pool[:n]) for n in n_samples]
+
+
+def resampled_frame(graph: dict, X_new: np.ndarray) -> pd.DataFrame:
+    """
+    Frame of the original rows followed by synthetic minority rows.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        X_new (np.ndarray): Synthetic minority samples.
+
+    Returns:
+        pd.DataFrame: Predictors and target in the layout of
+        resample_with_borderline_smote.
+    """
+    df_resampled = pd.DataFrame(
+        np.vstack((graph["X"], X_new)), columns=graph["columns"]
+    ).astype(graph["dtypes"])
+    df_resampled[graph["target_name"]] = np.hstack(
+        (
+            graph["y"],
+            np.full(len(X_new), graph["minority_class"], graph["y"].dtype),
+        )
+    )
+    return df_resampled
+
+
+def synthetic_frame(graph: dict, X_new: np.ndarray) -> pd.DataFrame:
+    """
+    Frame of synthetic minority rows alone.
+
+    Args:
+        graph (dict): Output of fit_borderline_neighbours.
+        X_new (np.ndarray): Synthetic minority samples.
+
+    Returns:
+        pd.DataFrame: Predictors and target in the layout of
+        resampled_frame, without the original rows.
+    """
+    df_synthetic = pd.DataFrame(X_new, columns=graph["columns"]).astype(
+        graph["dtypes"]
+    )
+    df_synthetic[graph["target_name"]] = np.full(
+        len(X_new), graph["minority_class"], graph["y"].dtype
+    )
+    return df_synthetic
@@ -1,7 +1,11 @@
 
 
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import OneHotEncoder
+from src.utils.abalone_schema import SEX_CATEGORIES
+
+UNKNOWN_CATEGORY_POLICIES = ("error", "ignore")
 
 def encode_abalone(data: pd.DataFrame) -> pd.DataFrame:
     
@@ -13,7 +17,7 @@ def encode_abalone(data: pd.DataFrame) -> pd.DataFrame:
     encoder = OneHotEncoder(drop=None, sparse_output=False)
     sex_encoded = encoder.fit_transform(predictors[["Sex"]])
 
-    target_encoded = data['Class'].map({'negative': 0, 'positive': 1})
+    target_encoded = encode_target(target)
     # Convert to DataFrame with proper column names
     sex_encoded_df = pd.DataFrame(sex_encoded, columns=encoder.get_feature_names_out(["Sex"]))
 
@@ -23,4 +27,68 @@ def encode_abalone(data: pd.DataFrame) -> pd.DataFrame:
 
     # Combine with target column
     abalone_encoded_df = pd.concat([predictors_encoded, target_encoded.reset_index(drop=True)], axis=1)
-    return abalone_encoded_df
\ No newline at end of file
+    return abalone_encoded_df
+
+
+def encode_target(target: pd.Series) -> pd.Series:
+    # Typed extraction already delivers 'Class' as 0/1 integers
+    if pd.api.types.is_numeric_dtype(target):
+        return target
+    return target.map({'negative': 0, 'positive': 1})
+
+
+def encode_abalone_native(
+    data: pd.DataFrame,
+    categories=SEX_CATEGORIES,
+    handle_unknown: str = "error",
+) -> pd.DataFrame:
+    # Same layout as encode_abalone, but the indicators come straight from
+    # categorical codes as uint8 columns, with a fixed vocabulary rather
+    # than whatever values happen to be present in this batch
+    sex_encoded_df = one_hot_encode(
+        data["Sex"], categories, handle_unknown=handle_unknown
+    )
+    predictors = data.drop(columns=["Sex", "Class"])
+    target_encoded = encode_target(data["Class"])
+
+    return pd.concat(
+        [predictors, sex_encoded_df, target_encoded], axis=1
+    ).reset_index(drop=True)
+
+
+def one_hot_encode(
+    column: pd.Series, categories, handle_unknown: str = "error"
+) -> pd.DataFrame:
+    codes = category_codes(column, categories, handle_unknown)
+    indicators = np.zeros((len(column), len(categories)), dtype=np.uint8)
+    known = np.flatnonzero(codes >= 0)
+    indicators[known, codes[known]] = 1
+    return pd.DataFrame(
+        indicators,
+        columns=[f"{column.name}_{category}" for category in categories],
+        index=column.index,
+    )
+
+
+def category_codes(
+    column: pd.Series, categories, handle_unknown: str = "error"
+) -> np.ndarray:
+    # Categorical input with the same vocabulary is used as-is; anything
+    # else is mapped onto the vocabulary once, in C, instead of per row
+    if handle_unknown not in UNKNOWN_CATEGORY_POLICIES:
+        raise ValueError(
+            f"handle_unknown must be one of {UNKNOWN_CATEGORY_POLICIES}"
+        )
+    if isinstance(column.dtype, pd.CategoricalDtype) and list(
+        column.cat.categories
+    ) == list(categories):
+        codes = column.cat.codes.to_numpy()
+    else:
+        codes = pd.Categorical(column, categories=categories).codes
+
+    # Unknown values (and missing ones) get code -1; with "ignore" their
+    # indicator row stays all zero
+    if handle_unknown == "error" and (codes < 0).any():
+        unknown = column[codes < 0].unique().tolist()
+        raise ValueError(f"Unknown '{column.name}' categories: {unknown}")
+    return codes
@@ -1,6 +1,119 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+from src.transform.version_set import (
+    LABEL_COLUMNS,
+    VersionSet,
+    sorted_labels,
+)
 
 
-import pandas as pd
-def merge_abalone_df(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
-    merged_abalone_data = pd.concat(df.values(), axis=0)
-    return merged_abalone_data
\ No newline at end of file
+def merge_abalone_df(
+    df,
+    tags: Optional[Dict[str, int]] = None,
+    labels: Optional[Dict[str, Dict[str, object]]] = None,
+) -> pd.DataFrame:
+    """
+    Tag each data version with its IR and merge them into one frame.
+
+    The total row count is known up front, so every column is allocated
+    once and filled version by version instead of concatenating copies.
+
+    Args:
+        df: Dict of version frames or a VersionSet.
+        tags (Dict[str, int]): IR tag per version name. Defaults to the
+            tags of a VersionSet, then to an existing 'IR' column, then to
+            5, 10, 15, ... in version order.
+        labels (Dict[str, Dict[str, object]]): Value per version name of
+            'Kind', 'Seed' or 'Replicate'. Defaults to the labels of a
+            VersionSet, then to existing label columns.
+
+    Returns:
+        pd.DataFrame: All versions with a RangeIndex, a categorical 'Kind'
+        and compact integer 'Seed' and 'Replicate' columns when labelled,
+        then a compact integer 'IR' column.
+    """
+    names = list(df)
+    if not names:
+        raise ValueError("Cannot merge an empty set of data versions")
+    tags = _resolve_tags(df, names, tags)
+    labels = sorted_labels(_resolve_labels(df, names, labels))
+    n_rows = [
+        df.n_rows(name) if isinstance(df, VersionSet) else len(df[name])
+        for name in names
+    ]
+
+    template = df.base if isinstance(df, VersionSet) else df[names[0]]
+    columns = [
+        col for col in template.columns
+        if col != "IR" and col not in LABEL_COLUMNS
+    ]
+    merged = {
+        col: np.empty(sum(n_rows), dtype=template[col].dtype)
+        for col in columns
+    }
+    # Kind is filled as category codes, the other labels as small integers
+    categories = {}
+    for column, values in labels.items():
+        values = list(dict.fromkeys(values.values()))
+        if column == "Kind":
+            categories[column] = values
+            values = range(len(values))
+        merged[column] = np.empty(sum(n_rows), dtype=_tag_dtype(values))
+    merged["IR"] = np.empty(sum(n_rows), dtype=_tag_dtype(tags.values()))
+
+    start = 0
+    for name, rows in zip(names, n_rows):
+        parts = df.views(name) if isinstance(df, VersionSet) else [df[name]]
+        part_start = start
+        for part in parts:
+            part_stop = part_start + len(part)
+            for col in columns:
+                merged[col][part_start:part_stop] = part[col].to_numpy()
+            part_start = part_stop
+        for column, values in labels.items():
+            value = values[name]
+            if column in categories:
+                value = categories[column].index(value)
+            merged[column][start:start + rows] = value
+        merged["IR"][start:start + rows] = tags[name]
+        start += rows
+
+    for column, column_categories in categories.items():
+        merged[column] = pd.Categorical.from_codes(
+            merged[column], column_categories
+        )
+
+    # Columns are handed over as they are, without consolidating copies
+    return pd.DataFrame(merged, copy=False)
+
+
+def _resolve_tags(df, names, tags):
+    if tags is not None:
+        return tags
+    if isinstance(df, VersionSet) and df.tags:
+        return df.tags
+    if not isinstance(df, VersionSet) and "IR" in df[names[0]]:
+        return {name: int(df[name]["IR"].iloc[0]) for name in names}
+    return {name: 5 * (position + 1) for position, name in enumerate(names)}
+
+
+def _resolve_labels(df, names, labels):
+    if labels is not None:
+        return labels
+    if isinstance(df, VersionSet):
+        return df.labels
+    return {
+        column: {name: df[name][column].iloc[0] for name in names}
+        for column in LABEL_COLUMNS
+        if column in df[names[0]]
+    }
+
+
+def _tag_dtype(tags):
+    # IR values are small percentages, so int8 nearly always suffices
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if all(info.min <= tag <= info.max for tag in tags):
+            return dtype
+    return np.int64
@@ -0,0 +1,103 @@
+import numpy as np
+from functools import partial
+from scipy.spatial import cKDTree
+from sklearn.neighbors import NearestNeighbors
+
+# Distances held at once (queries x rows) by the brute-force backend,
+# 128 MiB in float64
+DISTANCE_BLOCK_ELEMENTS = 1 << 24
+
+# Distance slack of the approximate backend
+APPROXIMATE_EPS = 0.5
+
+
+def kneighbors(
+    data: np.ndarray,
+    queries: np.ndarray,
+    n_neighbors: int,
+    algorithm: str = "auto",
+) -> np.ndarray:
+    """
+    Indices of the nearest rows of data for each query row.
+
+    Args:
+        data (np.ndarray): Rows searched, shape (n_samples, n_features).
+        queries (np.ndarray): Query rows, shape (n_queries, n_features).
+        n_neighbors (int): Neighbours returned per query, nearest first.
+        algorithm (str): A NEIGHBOUR_BACKENDS name. 'auto' lets
+            scikit-learn choose, as imblearn does; 'ckdtree' is an exact,
+            multi-threaded KD-tree; 'approximate' trades a little recall
+            for speed on large inputs.
+
+    Returns:
+        np.ndarray: Neighbour indices, shape (n_queries, n_neighbors).
+    """
+    if algorithm not in NEIGHBOUR_BACKENDS:
+        raise ValueError(
+            f"Unknown neighbour search '{algorithm}', "
+            f"expected one of {list(NEIGHBOUR_BACKENDS)}"
+        )
+    if n_neighbors > len(data):
+        raise ValueError(
+            f"Cannot find {n_neighbors} neighbours among {len(data)} rows"
+        )
+    return NEIGHBOUR_BACKENDS[algorithm](data, queries, n_neighbors)
+
+
+def brute_kneighbors(
+    data, queries, n_neighbors, block_elements=DISTANCE_BLOCK_ELEMENTS
+):
+    # Squared distances |q|^2 - 2 q.x + |x|^2 for one block of queries at a
+    # time, sized so the distance block stays within block_elements
+    data_norms = np.einsum("ij,ij->i", data, data)
+    indices = np.empty((len(queries), n_neighbors), dtype=np.intp)
+    for block in _query_blocks(len(queries), len(data), block_elements):
+        distances = data_norms - 2 * queries[block] @ data.T
+        distances += np.einsum("ij,ij->i", queries[block], queries[block])[
+            :, np.newaxis
+        ]
+        indices[block] = _nearest(distances, n_neighbors)
+    return indices
+
+
+def approximate_kneighbors(data, queries, n_neighbors, eps=APPROXIMATE_EPS):
+    # A (1 + eps)-approximate KD-tree search: each returned neighbour is
+    # at most (1 + eps) times farther than the true one, which lets the
+    # search prune branches early. eps=0 gives the exact neighbours
+    tree = cKDTree(data)
+    _, indices = tree.query(queries, k=n_neighbors, eps=eps, workers=-1)
+    return indices.reshape(len(queries), n_neighbors)
+
+
+def _sklearn_backend(algorithm):
+    def sklearn_kneighbors(data, queries, n_neighbors):
+        search = NearestNeighbors(n_neighbors=n_neighbors, algorithm=algorithm)
+        return search.fit(data).kneighbors(queries, return_distance=False)
+
+    return sklearn_kneighbors
+
+
+def _query_blocks(n_queries, row_elements, block_elements):
+    block_size = max(1, block_elements // max(1, row_elements))
+    for start in range(0, n_queries, block_size):
+        yield slice(start, start + block_size)
+
+
+def _nearest(distances, n_neighbors):
+    # Partial selection of the k smallest, then sort only those k
+    nearest = np.argpartition(distances, n_neighbors - 1, axis=1)
+    nearest = nearest[:, :n_neighbors]
+    order = np.argsort(
+        np.take_along_axis(distances, nearest, axis=1), axis=1, kind="stable"
+    )
+    return np.take_along_axis(nearest, order, axis=1)
+
+
+NEIGHBOUR_BACKENDS = {
+    "auto": _sklearn_backend("auto"),
+    "brute": brute_kneighbors,
+    "kd_tree": _sklearn_backend("kd_tree"),
+    "ball_tree": _sklearn_backend("ball_tree"),
+    "ckdtree": partial(approximate_kneighbors, eps=0.0),
+    "approximate": approximate_kneighbors,
+}
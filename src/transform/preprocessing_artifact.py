@@ -0,0 +1,76 @@
+import os
+import json
+import hashlib
+import numpy as np
+from datetime import datetime, timezone
+from src.utils.file_utils import ROOT_DIR
+
+# Bump when the stored fields or their meaning change
+ARTIFACT_VERSION = 1
+
+ARTIFACT_DIR = os.path.join(ROOT_DIR, "data", "processed")
+
+
+def save_preprocessing_artifact(
+    params: dict, output_dir: str = ARTIFACT_DIR
+) -> str:
+    """
+    Persist fitted standardization statistics and the category vocabulary.
+
+    Args:
+        params (dict): Parameters from fit_standardize_encode.
+        output_dir (str): Directory to write the artifact to.
+
+    Returns:
+        str: Path of the written artifact. The name carries the artifact
+        version and a digest of the fitted values, so refits that change
+        nothing reuse the same file.
+    """
+    artifact = {
+        "artifact_version": ARTIFACT_VERSION,
+        "numeric_columns": list(params["numeric_columns"]),
+        "mean": np.asarray(params["mean"]).tolist(),
+        "scale": np.asarray(params["scale"]).tolist(),
+        "categories": list(params["categories"]),
+    }
+    fit_id = hashlib.sha256(
+        json.dumps(artifact, sort_keys=True).encode()
+    ).hexdigest()[:12]
+    artifact["fit_id"] = fit_id
+    artifact["created_at"] = datetime.now(timezone.utc).isoformat()
+
+    os.makedirs(output_dir, exist_ok=True)
+    artifact_path = os.path.join(
+        output_dir, f"preprocessing_v{ARTIFACT_VERSION}_{fit_id}.json"
+    )
+    with open(artifact_path, "w") as file:
+        json.dump(artifact, file, indent=2)
+    return artifact_path
+
+
+def load_preprocessing_artifact(artifact_path: str) -> dict:
+    """
+    Load a persisted preprocessing artifact for apply_standardize_encode.
+
+    Args:
+        artifact_path (str): Path written by save_preprocessing_artifact.
+
+    Returns:
+        dict: Parameters in the form returned by fit_standardize_encode.
+    """
+    with open(artifact_path, "r") as file:
+        artifact = json.load(file)
+
+    version = artifact.get("artifact_version")
+    if version != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported preprocessing artifact version {version} in "
+            f"{artifact_path}, expected {ARTIFACT_VERSION}"
+        )
+
+    return {
+        "numeric_columns": artifact["numeric_columns"],
+        "mean": np.array(artifact["mean"], dtype=np.float64),
+        "scale": np.array(artifact["scale"], dtype=np.float64),
+        "categories": artifact["categories"],
+    }
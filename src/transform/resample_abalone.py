@@ -1,28 +1,564 @@
+import logging
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import groupby
+from typing import Iterator, Optional, Tuple
 from imblearn.over_sampling import BorderlineSMOTE
+import numpy as np
 import pandas as pd
+from src.transform.borderline_smote import (
+    BORDERLINE_KINDS,
+    fit_borderline_neighbours,
+    nested_synthetic_pool,
+    resampled_frame,
+    sample_borderline_replicates,
+    synthetic_frame,
+    synthetic_sample_count,
+)
+from src.transform.resampling_engines import (
+    get_resampling_engine,
+    prepare_sampler_inputs,
+    resample_with_sampler,
+)
+from src.transform.version_set import VersionSet
+from src.utils.logging_utils import setup_logger, log_resample_success
 
+logger = setup_logger(__name__, "transform_data.log", level=logging.DEBUG)
 
-def generate_imb_data_version(df: pd.DataFrame)-> dict[str, pd.DataFrame]:
-    imb_datasets_dic = {}
-    ratio_values = [0.05,0.10,0.15,0.20,0.25,0.30,0.35,0.40,0.45,
-                    0.50,0.55,0.60,0.65,0.70,0.75,0.80,0.85,0.90,0.95,1.0]
+RATIO_VALUES = [0.05, 0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40, 0.45,
+                0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85, 0.90, 0.95,
+                1.0]
+
+
+def _prepare_imblearn_borderline(X, y, kind="borderline-1"):
+    # imblearn refits for every ratio, so only its kind is fixed up front
+    return prepare_sampler_inputs(X, y), partial(BorderlineSMOTE, kind=kind)
+
+
+def _resample_imblearn_borderline(state, imb_ratio, random_state=42):
+    inputs, sampler_class = state
+    return resample_with_sampler(
+        sampler_class, inputs, imb_ratio, random_state=random_state
+    )
+
+
+# The per-ratio imblearn BorderlineSMOTE path used by share_neighbours=False
+IMBLEARN_BORDERLINE_ENGINE = {
+    "prepare": _prepare_imblearn_borderline,
+    "resample": _resample_imblearn_borderline,
+}
+
+# Set in each pool worker by _init_resample_worker
+_shared_resample = None
+_shared_states = None
+_shared_profile_memory = False
+
+
+def build_version_grid(
+    ratios=RATIO_VALUES, kinds=None, seeds=(42,)
+) -> list[dict]:
+    """
+    The (ratio, kind, seed) jobs of one resampling run.
+
+    Repeated combinations are only run once. Versions are named and
+    tagged after their ratio; the kind and seed are added to the name
+    only when the grid has more than one of them.
+
+    Args:
+        ratios: Requested minority/majority ratios.
+        kinds: BorderlineSMOTE kinds, or None for the engine's default.
+        seeds: Random states of the resampling.
+
+    Returns:
+        list[dict]: One job per version with its 'name', 'ratio', 'kind',
+        'seed' and 'ir' tag, grouped by kind, then seed, with the ratios
+        in the order given.
+    """
+    for kind in kinds or []:
+        if kind not in BORDERLINE_KINDS:
+            raise ValueError(
+                f"kind must be one of {BORDERLINE_KINDS}, got '{kind}'"
+            )
+    keys = dict.fromkeys(
+        (float(ratio), kind, int(seed))
+        for kind in (kinds or [None])
+        for seed in seeds
+        for ratio in ratios
+    )
+    if not keys:
+        raise ValueError("The resampling grid needs ratios and seeds")
+    name_kind = len({kind for _, kind, _ in keys}) > 1
+    name_seed = len({seed for _, _, seed in keys}) > 1
+
+    grid = []
+    names = set()
+    for ratio, kind, seed in keys:
+        ir = ratio_tag(ratio)
+        if ir < 1:
+            raise ValueError(
+                f"Ratio {ratio} is below 0.005 and has no IR tag"
+            )
+        name = f"abalone_df_{ir}"
+        if name_kind:
+            name += f"_{kind.replace('-', '')}"
+        if name_seed:
+            name += f"_seed{seed}"
+        if name in names:
+            raise ValueError(
+                f"Ratio {ratio} has the same IR tag as another ratio of "
+                "the grid"
+            )
+        names.add(name)
+        grid.append(
+            {"name": name, "ratio": ratio, "kind": kind, "seed": seed,
+             "ir": ir}
+        )
+    return grid
+
+
+def grid_labels(grid: list[dict]) -> dict[str, dict]:
+    """
+    The 'Kind' and 'Seed' of each version of a resampling grid.
+
+    Versions of a grid with several kinds or seeds share their IR tag, so
+    they are labelled with both; a grid of one kind and seed needs none.
+
+    Args:
+        grid: Jobs from build_version_grid.
+
+    Returns:
+        dict[str, dict]: Version name to value for 'Kind' and 'Seed', or
+        an empty dict. 'Kind' is left out when the engine's default kind
+        is used.
+    """
+    if len({(job["kind"], job["seed"]) for job in grid}) < 2:
+        return {}
+    labels = {"Seed": {job["name"]: job["seed"] for job in grid}}
+    if all(job["kind"] is not None for job in grid):
+        labels["Kind"] = {job["name"]: job["kind"] for job in grid}
+    return labels
+
+
+def ratio_tag(imb_ratio: float) -> int:
+    # IR tag of a ratio in percent, e.g. 0.05 -> 5
+    return int(round(imb_ratio * 100))
+
+
+def generate_imb_data_version(
+    df: pd.DataFrame, **options
+) -> dict[str, pd.DataFrame]:
+    # All versions at once; see iter_imb_data_versions for the options
+    return dict(iter_imb_data_versions(df, **options))
+
+
+def generate_version_set(df: pd.DataFrame, **options) -> VersionSet:
+    # Versions delta-encoded against the original rows, built one version
+    # at a time; see iter_imb_data_versions for the options. Only versions
+    # drawn from the same nested pool are prefixes of each other
+    grid = options.get("grid") or build_version_grid()
+    pools = {(job["kind"], job["seed"]) for job in grid}
+    return VersionSet.from_versions(
+        iter_imb_data_versions(df, **options),
+        n_base=len(df),
+        nested=options.get("nested", False) and len(pools) == 1,
+    )
+
+
+def generate_replicate_set(
+    df: pd.DataFrame,
+    n_replicates: int,
+    ratios=RATIO_VALUES,
+    kind: str = "borderline-1",
+    random_state: int = 42,
+    nested: bool = False,
+    dtype=np.float64,
+    neighbour_algorithm: str = "auto",
+    workers: Optional[int] = None,
+    profile_memory: bool = False,
+) -> VersionSet:
+    """
+    Generate replicate BorderlineSMOTE versions of every ratio in one pass.
+
+    The neighbour graph is fitted once and the synthetic samples of all
+    replicates of a ratio are drawn and interpolated as one batch, so each
+    extra replicate costs about one interpolation rather than a full run.
+    Each ratio's batch is drawn from its own stream spawned from
+    random_state, so replicates are independent of each other and of the
+    other ratios' replicates, but not the same as per-seed versions.
+
+    Args:
+        df (pd.DataFrame): Encoded frame with a binary 'Class' column.
+        n_replicates (int): Replicates per ratio.
+        ratios: Requested minority/majority ratios.
+        kind (str): 'borderline-1' or 'borderline-2'.
+        random_state (int): Seed of the batched draws.
+        nested (bool): Draw one pool per replicate for the largest ratio
+            and take every lower ratio as a prefix of it; the ratios of a
+            replicate then share their synthetic samples by design.
+        dtype: Float dtype of the neighbour search and synthetic samples.
+        neighbour_algorithm (str): Neighbour search backend.
+        workers (int): Worker processes; above one the ratios' batches are
+            drawn in a process pool.
+        profile_memory (bool): Also log the peak memory of each step.
+
+    Returns:
+        VersionSet: Versions named abalone_df_<IR>_rep<replicate>, tagged
+        with their IR and replicate index, grouped by ratio.
+    """
+    if n_replicates < 1:
+        raise ValueError(
+            f"n_replicates must be at least 1, got {n_replicates}"
+        )
+    ratios = list(dict.fromkeys(float(ratio) for ratio in ratios))
+    tags = [ratio_tag(ratio) for ratio in ratios]
+    if len(set(tags)) != len(tags):
+        raise ValueError("Two ratios of the grid have the same IR tag")
+    if min(tags) < 1:
+        raise ValueError("Ratios below 0.005 have no IR tag")
+    profile = partial(_profile, trace_memory=profile_memory)
+
+    graph, execution_time, peak_memory = profile(
+        fit_borderline_neighbours,
+        df.drop(columns=["Class"]),
+        df["Class"],
+        kind=kind,
+        dtype=dtype,
+        algorithm=neighbour_algorithm,
+    )
+    log_resample_success(
+        logger, "borderline_smote", "prepare", df.shape, execution_time,
+        peak_memory,
+    )
+    n_samples = [synthetic_sample_count(graph, ratio) for ratio in ratios]
+
+    # One (replicates x samples) batch per ratio, or a single batch of
+    # pools when nested; each block is a run of rows of one synthetic frame
+    if nested:
+        batches = [(max(n_samples), range(len(ratios)))]
+    else:
+        batches = [(n, [position]) for position, n in enumerate(n_samples)]
+    seeds = [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(random_state).spawn(len(batches))
+    ]
+    sample_batch = partial(_replicate_batch, n_replicates=n_replicates)
+    batch_sizes = [batch_size for batch_size, _ in batches]
+    if workers and workers > 1 and len(batches) > 1:
+        # The graph is pickled once per worker by the initializer
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_resample_worker,
+            initargs=(sample_batch, {kind: graph}, profile_memory),
+        ) as executor:
+            profiled_blocks = list(
+                executor.map(
+                    _sample_replicate_batch, [kind] * len(batches),
+                    batch_sizes, seeds,
+                )
+            )
+    else:
+        profiled_blocks = [
+            profile(sample_batch, graph, batch_size, random_state=seed)
+            for batch_size, seed in zip(batch_sizes, seeds)
+        ]
+
+    blocks = []
+    slices = {}
+    offset = 0
+    for (batch_size, positions), profiled_block in zip(
+        batches, profiled_blocks
+    ):
+        block, execution_time, peak_memory = profiled_block
+        log_resample_success(
+            logger,
+            "borderline_smote",
+            f"{n_replicates} replicates",
+            block.shape,
+            execution_time,
+            peak_memory,
+        )
+        for position in positions:
+            for replicate in range(n_replicates):
+                start = offset + replicate * batch_size
+                name = f"abalone_df_{tags[position]}_rep{replicate}"
+                slices[name] = (start, start + n_samples[position])
+        blocks.append(block.reshape(-1, block.shape[-1]))
+        offset += block.shape[0] * block.shape[1]
+
+    # Order the versions by ratio, then replicate
+    keys = {
+        f"abalone_df_{tag}_rep{replicate}": (tag, replicate)
+        for tag in tags
+        for replicate in range(n_replicates)
+    }
+    return VersionSet(
+        resampled_frame(graph, graph["X"][:0]),
+        synthetic_frame(graph, np.concatenate(blocks)),
+        {name: slices[name] for name in keys},
+        tags={name: tag for name, (tag, _) in keys.items()},
+        replicates={name: replicate for name, (_, replicate) in keys.items()},
+    )
+
+
+def _replicate_batch(graph, batch_size, random_state, n_replicates):
+    return sample_borderline_replicates(
+        graph, batch_size, n_replicates, random_state
+    )
+
+
+def iter_imb_data_versions(
+    df: pd.DataFrame,
+    workers: Optional[int] = None,
+    share_neighbours: bool = True,
+    nested: bool = False,
+    dtype=np.float64,
+    neighbour_algorithm: str = "auto",
+    engine: str = "borderline_smote",
+    grid: Optional[list] = None,
+    profile_memory: bool = False,
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Generate the imbalance-ratio versions of a frame one at a time.
+
+    Only the version being yielded (plus the engine's shared state) is
+    held, so a consumer that writes each version out before asking for
+    the next keeps peak memory at about one version.
+
+    Args:
+        df (pd.DataFrame): Encoded frame with a binary 'Class' column.
+        workers (int): Worker processes; above one the grid's jobs are
+            resampled in a process pool and yielded in grid order.
+        share_neighbours (bool): Use the shared BorderlineSMOTE neighbour
+            graph instead of a fresh imblearn fit per ratio.
+        nested (bool): Take every version as a prefix of one synthetic
+            pool drawn for the largest ratio of its kind and seed.
+        dtype: Float dtype of the BorderlineSMOTE engine.
+        neighbour_algorithm (str): Neighbour search backend.
+        engine (str): A RESAMPLING_ENGINES name.
+        grid (list): Jobs from build_version_grid. Defaults to the 20
+            RATIO_VALUES with the engine's default kind and seed 42.
+        profile_memory (bool): Also log the peak memory of each step.
+            Tracing every allocation slows resampling, so only the wall
+            time is logged by default.
+
+    Returns:
+        Iterator[Tuple[str, pd.DataFrame]]: Version names and resampled
+        frames, in grid order.
+    """
+    resampling_engine = get_resampling_engine(engine)
+    if grid is None:
+        grid = build_version_grid()
+    borderline_options = {}
+    if np.dtype(dtype) != np.float64:
+        borderline_options["dtype"] = dtype
+    if neighbour_algorithm != "auto":
+        borderline_options["algorithm"] = neighbour_algorithm
+    kinds = list(dict.fromkeys(job["kind"] for job in grid))
+    if engine != "borderline_smote" and (
+        nested or borderline_options or not share_neighbours
+        or kinds != [None]
+    ):
+        raise ValueError(
+            "share_neighbours, nested, dtype, neighbour_algorithm and kinds "
+            "only apply to the borderline_smote engine"
+        )
+    if nested and not share_neighbours:
+        raise ValueError("Nested versions require share_neighbours=True")
+    if borderline_options and not share_neighbours:
+        raise ValueError(
+            "dtype and neighbour_algorithm need share_neighbours=True"
+        )
+    if nested and workers and workers > 1:
+        raise ValueError("Nested versions are built in a single process")
+    if not share_neighbours:
+        resampling_engine = IMBLEARN_BORDERLINE_ENGINE
+
+    # Options are checked above, before the first version is asked for
+    return _generate_versions(
+        df, engine, resampling_engine, borderline_options, workers, nested,
+        grid, kinds, profile_memory,
+    )
+
+
+def _generate_versions(
+    df, engine, resampling_engine, borderline_options, workers, nested,
+    grid, kinds, profile_memory,
+):
+    profile = partial(_profile, trace_memory=profile_memory)
     predictors = df.drop(columns=["Class"])  # predictors
-    target = df["Class"] 
-    for imb_ratio in ratio_values:
-        dataset_version = resample_with_borderline_smote(predictors, target, imb_ratio)
-        imb_datasets_dic[f"abalone_df_{int(imb_ratio * 100)}"] = dataset_version.copy()
-    return imb_datasets_dic
+    target = df["Class"]
+
+    # Whatever does not depend on the ratio or seed (e.g. the
+    # BorderlineSMOTE neighbour searches) is prepared once per kind here
+    # instead of once per job
+    states = {}
+    for kind in kinds:
+        options = dict(borderline_options)
+        if kind is not None:
+            options["kind"] = kind
+        states[kind], execution_time, peak_memory = profile(
+            resampling_engine["prepare"], predictors, target, **options
+        )
+        log_resample_success(
+            logger,
+            engine,
+            "prepare" if kind is None else f"prepare {kind}",
+            df.shape,
+            execution_time,
+            peak_memory,
+        )
+    resample = resampling_engine["resample"]
+
+    if nested:
+        # One synthetic pool per kind and seed for its largest ratio; every
+        # lower ratio is a prefix of it, so the versions are supersets of
+        # each other
+        for (kind, seed), jobs in groupby(
+            grid, key=lambda job: (job["kind"], job["seed"])
+        ):
+            jobs = list(jobs)
+            state = states[kind]
+            (pool, n_samples), execution_time, peak_memory = profile(
+                nested_synthetic_pool,
+                state,
+                [job["ratio"] for job in jobs],
+                seed,
+            )
+            log_resample_success(
+                logger,
+                engine,
+                "nested pool",
+                pool.shape,
+                execution_time,
+                peak_memory,
+            )
+            yield from _logged_versions(
+                engine,
+                [job["name"] for job in jobs],
+                (
+                    profile(resampled_frame, state, pool[:n])
+                    for n in n_samples
+                ),
+            )
+    elif workers and workers > 1:
+        # The shared states are pickled once per worker by the initializer
+        # instead of once per job; map keeps the results in grid order
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_resample_worker,
+            initargs=(resample, states, profile_memory),
+        ) as executor:
+            yield from _logged_versions(
+                engine,
+                [job["name"] for job in grid],
+                executor.map(
+                    _resample_shared,
+                    [job["kind"] for job in grid],
+                    [job["ratio"] for job in grid],
+                    [job["seed"] for job in grid],
+                ),
+            )
+    else:
+        yield from _logged_versions(
+            engine,
+            [job["name"] for job in grid],
+            (
+                profile(
+                    resample,
+                    states[job["kind"]],
+                    job["ratio"],
+                    random_state=job["seed"],
+                )
+                for job in grid
+            ),
+        )
+
 
+def _logged_versions(engine, names, profiled_versions):
+    for name, (dataset_version, execution_time, peak_memory) in zip(
+        names, profiled_versions
+    ):
+        log_resample_success(
+            logger,
+            engine,
+            name,
+            dataset_version.shape,
+            execution_time,
+            peak_memory,
+        )
+        yield name, dataset_version
+
+
+def resample_with_borderline_smote(
+    X, y, target_minority_ratio, kind='borderline-1', random_state=42
+):
 
-def resample_with_borderline_smote(X, y, target_minority_ratio, kind='borderline-1', random_state=42):
-    
     # Ensure y is Series
     y = pd.Series(y, name=y.name or "target")
     # Apply BorderlineSMOTE
-    smote = BorderlineSMOTE(kind=kind, sampling_strategy=target_minority_ratio, random_state=random_state)
+    smote = BorderlineSMOTE(
+        kind=kind,
+        sampling_strategy=target_minority_ratio,
+        random_state=random_state,
+    )
     X_resampled, y_resampled = smote.fit_resample(X, y)
 
     # Merge into a single DataFrame
     df_resampled = pd.DataFrame(X_resampled, columns=X.columns)
     df_resampled[y.name] = y_resampled
     return df_resampled
+
+
+def _init_resample_worker(resample, states, profile_memory):
+    global _shared_resample, _shared_states, _shared_profile_memory
+    _shared_resample = resample
+    _shared_states = states
+    _shared_profile_memory = profile_memory
+
+
+def _resample_shared(kind, imb_ratio, seed):
+    return _profile(
+        _shared_resample,
+        _shared_states[kind],
+        imb_ratio,
+        random_state=seed,
+        trace_memory=_shared_profile_memory,
+    )
+
+
+def _sample_replicate_batch(kind, batch_size, seed):
+    # The shared resample is a _replicate_batch drawing batch_size
+    # synthetic rows for every replicate
+    return _profile(
+        _shared_resample,
+        _shared_states[kind],
+        batch_size,
+        random_state=seed,
+        trace_memory=_shared_profile_memory,
+    )
+
+
+def _profile(func, *args, trace_memory=False, **kwargs):
+    # Wall time of func and, with trace_memory, the peak of memory traced
+    # while it ran in bytes (None otherwise). NumPy reports its buffers to
+    # tracemalloc, so array memory is included
+    if not trace_memory:
+        start_time = timeit.default_timer()
+        result = func(*args, **kwargs)
+        return result, timeit.default_timer() - start_time, None
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    start_time = timeit.default_timer()
+    try:
+        result = func(*args, **kwargs)
+        execution_time = timeit.default_timer() - start_time
+        peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return result, execution_time, peak_memory
@@ -0,0 +1,94 @@
+import pandas as pd
+from functools import partial
+from imblearn.over_sampling import ADASYN, SMOTE, RandomOverSampler
+from imblearn.under_sampling import RandomUnderSampler
+from src.transform.borderline_smote import (
+    fit_borderline_neighbours,
+    resample_from_neighbours,
+)
+
+
+def prepare_sampler_inputs(X: pd.DataFrame, y: pd.Series) -> tuple:
+    """
+    Shared state of the imblearn engines, which fit from scratch for
+    every ratio.
+
+    Args:
+        X (pd.DataFrame): Predictors.
+        y (pd.Series): Binary target.
+
+    Returns:
+        tuple: The predictors and the named target.
+    """
+    return X, pd.Series(y, name=y.name or "target")
+
+
+def resample_with_sampler(
+    sampler_class, state: tuple, target_minority_ratio, random_state=42
+) -> pd.DataFrame:
+    """
+    Resample to a minority/majority ratio with an imblearn sampler.
+
+    Args:
+        sampler_class: imblearn over- or under-sampler class.
+        state (tuple): Output of prepare_sampler_inputs.
+        target_minority_ratio (float): Requested minority/majority ratio.
+        random_state (int): Seed of the sampler.
+
+    Returns:
+        pd.DataFrame: Predictors and target of the resampled data.
+    """
+    X, y = state
+    sampler = sampler_class(
+        sampling_strategy=target_minority_ratio, random_state=random_state
+    )
+    X_resampled, y_resampled = sampler.fit_resample(X, y)
+
+    df_resampled = pd.DataFrame(X_resampled, columns=X.columns)
+    df_resampled[y.name] = y_resampled
+    return df_resampled.reset_index(drop=True)
+
+
+# Every engine turns (X, y) into a state once per input, then builds each
+# ratio version from that state. All return frames with the predictors
+# followed by the target, so the later stages do not depend on the engine
+RESAMPLING_ENGINES = {
+    "borderline_smote": {
+        "prepare": fit_borderline_neighbours,
+        "resample": resample_from_neighbours,
+    },
+    "smote": {
+        "prepare": prepare_sampler_inputs,
+        "resample": partial(resample_with_sampler, SMOTE),
+    },
+    "adasyn": {
+        "prepare": prepare_sampler_inputs,
+        "resample": partial(resample_with_sampler, ADASYN),
+    },
+    "random_oversampling": {
+        "prepare": prepare_sampler_inputs,
+        "resample": partial(resample_with_sampler, RandomOverSampler),
+    },
+    "random_undersampling": {
+        "prepare": prepare_sampler_inputs,
+        "resample": partial(resample_with_sampler, RandomUnderSampler),
+    },
+}
+
+
+def get_resampling_engine(name: str) -> dict:
+    """
+    Look up a resampling engine by name.
+
+    Args:
+        name (str): A RESAMPLING_ENGINES name.
+
+    Returns:
+        dict: The engine's 'prepare' and 'resample' functions.
+    """
+    if name not in RESAMPLING_ENGINES:
+        raise ValueError(
+            f"Unknown resampling engine '{name}', "
+            f"expected one of {list(RESAMPLING_ENGINES)}"
+        )
+    return RESAMPLING_ENGINES[name]
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+from src.transform.encode_abalone import category_codes, encode_target
+
+
+def standardize_and_encode(df: pd.DataFrame) -> pd.DataFrame:
+    # Same result as standardize_data followed by encode_abalone, written
+    # into one preallocated array instead of a chain of DataFrame copies
+    return apply_standardize_encode(df, fit_standardize_encode(df))
+
+
+def fit_standardize_encode(df: pd.DataFrame) -> dict:
+    # Numeric features are picked by position, as in standardize_data
+    numeric_cols = df.columns.tolist()[1:8]
+    values = df[numeric_cols].to_numpy(dtype=np.float64)
+
+    mean = values.mean(axis=0)
+    scale = values.std(axis=0)
+    # Constant columns are left unscaled, like StandardScaler does
+    scale[scale == 0.0] = 1.0
+
+    # OneHotEncoder orders its vocabulary by sorted value
+    categories = np.unique(df["Sex"].dropna().astype(str)).tolist()
+
+    return {
+        "numeric_columns": numeric_cols,
+        "mean": mean,
+        "scale": scale,
+        "categories": categories,
+    }
+
+
+def apply_standardize_encode(
+    df: pd.DataFrame, params: dict, handle_unknown: str = "error"
+) -> pd.DataFrame:
+    numeric_cols = params["numeric_columns"]
+    categories = params["categories"]
+    n_rows = len(df)
+    n_numeric = len(numeric_cols)
+
+    dtype = np.result_type(
+        *(df[col].dtype for col in numeric_cols), np.float32
+    )
+    # Column-major so every feature is written as one contiguous run and
+    # the array can back the DataFrame block without a copy
+    features = np.empty(
+        (n_rows, n_numeric + len(categories)), dtype=dtype, order="F"
+    )
+
+    for j, col in enumerate(numeric_cols):
+        column = features[:, j]
+        np.subtract(df[col].to_numpy(), params["mean"][j], out=column)
+        np.divide(column, params["scale"][j], out=column)
+
+    codes = category_codes(df["Sex"], categories, handle_unknown)
+    known = np.flatnonzero(codes >= 0)
+    features[:, n_numeric:] = 0
+    features[known, n_numeric + codes[known]] = 1
+
+    encoded_df = pd.DataFrame(
+        features,
+        columns=numeric_cols + [f"Sex_{category}" for category in categories],
+        copy=False,
+    )
+    encoded_df["Class"] = encode_target(df["Class"]).to_numpy()
+    return encoded_df
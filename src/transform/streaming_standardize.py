@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Iterable, Iterator
+from src.transform.standardize_encode_abalone import apply_standardize_encode
+
+
+def fit_streaming_standardize_encode(chunks: Iterable[pd.DataFrame]) -> dict:
+    # Running mean and sum of squared deviations, merged chunk by chunk
+    # with Chan et al.'s pairwise update (Welford's algorithm generalised
+    # to batches), so memory stays constant and no catastrophic
+    # cancellation creeps in over long inputs
+    numeric_cols = None
+    count = 0
+    mean = None
+    m2 = None
+    categories = set()
+
+    for chunk in chunks:
+        if numeric_cols is None:
+            numeric_cols = chunk.columns.tolist()[1:8]
+            mean = np.zeros(len(numeric_cols))
+            m2 = np.zeros(len(numeric_cols))
+        if chunk.empty:
+            continue
+
+        values = chunk[numeric_cols].to_numpy(dtype=np.float64)
+        chunk_count = values.shape[0]
+        chunk_mean = values.mean(axis=0)
+        chunk_m2 = ((values - chunk_mean) ** 2).sum(axis=0)
+
+        total = count + chunk_count
+        delta = chunk_mean - mean
+        mean += delta * (chunk_count / total)
+        m2 += chunk_m2 + delta**2 * (count * chunk_count / total)
+        count = total
+
+        categories.update(chunk["Sex"].dropna().astype(str).unique())
+
+    if not count:
+        raise ValueError("Cannot fit standardization on an empty input")
+
+    scale = np.sqrt(m2 / count)
+    # Constant columns are left unscaled, like StandardScaler does
+    scale[scale == 0.0] = 1.0
+
+    return {
+        "numeric_columns": numeric_cols,
+        "mean": mean,
+        "scale": scale,
+        "categories": sorted(categories),
+    }
+
+
+def stream_standardize_encode(
+    chunks: Iterable[pd.DataFrame], params: dict
+) -> Iterator[pd.DataFrame]:
+    for chunk in chunks:
+        yield apply_standardize_encode(chunk, params)
+
+
+def standardize_encode_chunks(
+    make_chunks: Callable[[], Iterable[pd.DataFrame]],
+) -> Iterator[pd.DataFrame]:
+    # make_chunks is called twice - once for the fitting pass and once for
+    # the applying pass - e.g. lambda: extract_data(chunksize=100_000)
+    params = fit_streaming_standardize_encode(make_chunks())
+    return stream_standardize_encode(make_chunks(), params)
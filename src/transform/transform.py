@@ -1,10 +1,24 @@
 import pandas as pd
-from typing import Tuple
+from typing import Optional, Tuple
 from src.transform.clean_abalone import clean_abalone
 from src.utils.logging_utils import setup_logger
-from src.transform.encode_abalone import encode_abalone
-from src.transform.standardize_abalone import standardize_data
-from src.transform.resample_abalone import generate_imb_data_version
+from src.transform.standardize_encode_abalone import (
+    fit_standardize_encode,
+    apply_standardize_encode,
+)
+from src.transform.preprocessing_artifact import (
+    save_preprocessing_artifact,
+    load_preprocessing_artifact,
+)
+from config.resample_config import load_resample_config
+from src.transform.resample_abalone import (
+    build_version_grid,
+    generate_imb_data_version,
+    generate_replicate_set,
+    generate_version_set,
+    grid_labels,
+    iter_imb_data_versions,
+)
 from src.transform.add_imbalance_tag import add_tag_to_data_versions
 from src.transform.merge_abalone_data_versions import merge_abalone_df
 from src.load.write_data_to_csv import write_data_versions_to_csv
@@ -12,25 +26,83 @@ from src.load.write_data_to_csv import write_data_versions_to_csv
 logger = setup_logger("transform_data", "transform_data.log")
 
 
-def transform_data(data) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def transform_data(
+    data,
+    resample_workers: Optional[int] = None,
+    stream_versions: bool = False,
+    delta_versions: bool = False,
+    resample_config: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     try:
         logger.info("Starting data transformation process...")
+
+        if not isinstance(data, pd.DataFrame):
+            # Streamed extraction hands over an iterator of chunks
+            logger.info("Collecting streamed Abalone chunks...")
+            data = pd.concat(data, ignore_index=True)
     
         logger.info("Cleaning Abalone data...")
         cleaned_abalone = clean_abalone(data)
         logger.info("Customer data cleaned successfully.")
         
-        # Standardize Abalone data
-        logger.info("Standardizing Abalone data...")
-        standardized_abalone = standardize_data(cleaned_abalone)
-        logger.info("Abalone data was standardized successfully.")
-        
-        logger.info("Encoding Abalone data ...")
-        encoded_abalone = encode_abalone(standardized_abalone)
-        logger.info("Abalone data encoded successfully.")
+        # Standardize and encode Abalone data in a single pass
+        logger.info("Standardizing and encoding Abalone data...")
+        preprocessing_params = fit_standardize_encode(cleaned_abalone)
+        artifact_path = save_preprocessing_artifact(preprocessing_params)
+        logger.info(f"Preprocessing artifact saved to {artifact_path}")
+        encoded_abalone = apply_standardize_encode(
+            cleaned_abalone, preprocessing_params
+        )
+        logger.info("Abalone data standardized and encoded successfully.")
+
+        # The ratio grid, kinds and seeds come from the environment unless
+        # a config is passed in; every version is tagged with its own ratio
+        if resample_config is None:
+            resample_config = load_resample_config()
+        if resample_workers is None:
+            resample_workers = resample_config["workers"]
+        if resample_config.get("replicates", 1) > 1:
+            return _transform_replicates(
+                encoded_abalone,
+                resample_config,
+                resample_workers,
+                stream_versions,
+                delta_versions,
+            )
+        grid = build_version_grid(
+            resample_config["ratios"],
+            resample_config["kinds"],
+            resample_config["seeds"],
+        )
+        ir_tags = {job["name"]: job["ir"] for job in grid}
+        # Versions sharing a ratio are told apart by their kind and seed
+        labels = grid_labels(grid)
+        logger.info(f"Resampling grid of {len(grid)} versions")
+
+        if stream_versions:
+            # Versions are resampled and tagged one at a time as the
+            # loader consumes them, so only one is held in memory
+            logger.info("Streaming Abalone data versions to the loader...")
+            return _log_stream_failures(
+                add_tag_to_data_versions(
+                    iter_imb_data_versions(
+                        encoded_abalone, workers=resample_workers, grid=grid
+                    ),
+                    tags=ir_tags,
+                    labels=labels,
+                )
+            )
         
         logger.info("Creating Abalone data versions...") 
-        abalone_data_versions = generate_imb_data_version(encoded_abalone)
+        if delta_versions:
+            # The original rows are stored once for all versions
+            abalone_data_versions = generate_version_set(
+                encoded_abalone, workers=resample_workers, grid=grid
+            )
+        else:
+            abalone_data_versions = generate_imb_data_version(
+                encoded_abalone, workers=resample_workers, grid=grid
+            )
         logger.info("Abalone data versions created successfully.")
         
         # used once to write csv versions of data into local machine.
@@ -38,15 +110,83 @@ def transform_data(data) -> Tuple[pd.DataFrame, pd.DataFrame]:
         #write_data_versions_to_csv(abalone_data_versions)
         #logger.info("Data versions writing to csv completed successfully.")
         
-        logger.info("Adding IR Column to each data versions...")
-        abalone_data_versions_with_tag = add_tag_to_data_versions(abalone_data_versions)
-        logger.info("Tag to each data version added successfully.")
-        
-        logger.info("Merging abalone data version...")
-        merged_abalone_data = merge_abalone_df(abalone_data_versions_with_tag)
-        logger.info("Tag to each data version added successfully.")
+        # The merge tags each version with its IR as it fills one
+        # preallocated frame, so the versions are not tagged in place first
+        logger.info("Merging and tagging abalone data versions...")
+        merged_abalone_data = merge_abalone_df(
+            abalone_data_versions, tags=ir_tags, labels=labels
+        )
+        logger.info("Abalone data versions merged successfully.")
 
         return merged_abalone_data
     except Exception as e:
         logger.error(f"Data transformation failed: {str(e)}")
         raise
+
+
+def _log_stream_failures(versions):
+    # Streamed versions are resampled while the loader consumes them, after
+    # transform_data has returned, so failures are logged here
+    try:
+        yield from versions
+    except Exception as e:
+        logger.error(f"Data transformation failed: {str(e)}")
+        raise
+
+
+def _transform_replicates(
+    encoded_abalone,
+    resample_config,
+    resample_workers,
+    stream_versions,
+    delta_versions,
+):
+    # Every replicate of every ratio comes from one neighbour fit and one
+    # batched draw per ratio, delta-encoded and tagged with its IR and
+    # replicate index
+    logger.info(
+        f"Creating {resample_config['replicates']} replicates of each "
+        "Abalone data version..."
+    )
+    replicate_set = generate_replicate_set(
+        encoded_abalone,
+        resample_config["replicates"],
+        ratios=resample_config["ratios"],
+        kind=resample_config["kinds"][0],
+        random_state=resample_config["seeds"][0],
+        workers=resample_workers,
+    )
+    logger.info("Abalone replicate versions created successfully.")
+    if stream_versions:
+        # Streamed versions carry the same Replicate and IR columns as
+        # the merged frame
+        return _log_stream_failures(replicate_set.items())
+
+    if delta_versions:
+        abalone_replicate_versions = replicate_set
+    else:
+        abalone_replicate_versions = dict(replicate_set.items())
+    logger.info("Merging abalone replicate versions...")
+    merged_abalone_data = merge_abalone_df(abalone_replicate_versions)
+    logger.info("Abalone replicate versions merged successfully.")
+    return merged_abalone_data
+
+
+def preprocess_data(data, artifact_path: str) -> pd.DataFrame:
+    # Transform-only mode: scale and encode a new batch with the statistics
+    # and vocabulary of an earlier run, without refitting or resampling
+    try:
+        logger.info(f"Loading preprocessing artifact {artifact_path}...")
+        preprocessing_params = load_preprocessing_artifact(artifact_path)
+
+        if not isinstance(data, pd.DataFrame):
+            data = pd.concat(data, ignore_index=True)
+
+        logger.info("Standardizing and encoding Abalone batch...")
+        encoded_abalone = apply_standardize_encode(data, preprocessing_params)
+        logger.info("Abalone batch standardized and encoded successfully.")
+
+        return encoded_abalone
+    except Exception as e:
+        logger.error(f"Data preprocessing failed: {str(e)}")
+        raise
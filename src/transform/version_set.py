@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+# Columns that tell apart versions sharing an IR tag, in the order they are
+# written before 'IR'
+LABEL_COLUMNS = ("Kind", "Seed", "Replicate")
+
+
+class VersionSet:
+    """
+    Imbalance-ratio versions stored as the shared original rows plus the
+    synthetic rows of each version.
+
+    Every over-sampled version is the original rows followed by its own
+    synthetic rows, so the original rows are kept once and each version
+    is a (start, stop) slice of one synthetic frame. Nested versions all
+    slice from the start of the same pool. Versions are only built into
+    full frames on demand.
+    """
+
+    def __init__(
+        self,
+        base: pd.DataFrame,
+        synthetic: pd.DataFrame,
+        slices: Dict[str, Tuple[int, int]],
+        tags: Optional[Dict[str, int]] = None,
+        replicates: Optional[Dict[str, int]] = None,
+        labels: Optional[Dict[str, Dict[str, object]]] = None,
+    ):
+        self.base = base
+        self.synthetic = synthetic
+        self.slices = dict(slices)
+        self.tags = dict(tags or {})
+        # LABEL_COLUMNS value of each version, e.g. its kind and seed or
+        # its replicate index
+        self.labels = dict(labels or {})
+        if replicates:
+            self.labels["Replicate"] = dict(replicates)
+
+    @property
+    def replicates(self) -> Dict[str, int]:
+        return self.labels.get("Replicate", {})
+
+    @classmethod
+    def from_versions(
+        cls,
+        versions: Iterable[Tuple[str, pd.DataFrame]],
+        n_base: int,
+        nested: bool = False,
+    ) -> "VersionSet":
+        """
+        Delta-encode a stream of (name, frame) versions.
+
+        Args:
+            versions: Versions whose first n_base rows are the original
+                rows, as produced by the over-sampling engines. Every
+                version must start with the same rows.
+            n_base (int): Number of original rows.
+            nested (bool): Whether the synthetic rows of each version are
+                a prefix of those of the largest version; only the
+                largest is then kept.
+
+        Returns:
+            VersionSet: The delta-encoded versions.
+        """
+        base = None
+        blocks = []
+        slices = {}
+        offset = 0
+        for name, version in versions:
+            if len(version) < n_base:
+                raise ValueError(
+                    f"Version {name} has fewer rows than the original "
+                    "data; only over-sampled versions can share them"
+                )
+            if base is None:
+                base = version.iloc[:n_base].reset_index(drop=True)
+            elif not version.iloc[:n_base].reset_index(drop=True).equals(
+                base
+            ):
+                # Engines that reorder or drop the original rows cannot
+                # share them
+                raise ValueError(
+                    f"Version {name} does not start with the original rows "
+                    "of the first version"
+                )
+            # Copy the tail so the full version frame can be released
+            block = version.iloc[n_base:].reset_index(drop=True).copy()
+            if nested:
+                slices[name] = (0, len(block))
+                if not blocks or len(block) > len(blocks[0]):
+                    blocks = [block]
+            else:
+                slices[name] = (offset, offset + len(block))
+                offset += len(block)
+                blocks.append(block)
+
+        if base is None:
+            raise ValueError("Cannot build a version set without versions")
+        synthetic = pd.concat(blocks, ignore_index=True)
+        return cls(base, synthetic, slices)
+
+    @property
+    def names(self) -> list:
+        return list(self.slices)
+
+    def __len__(self) -> int:
+        return len(self.slices)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.slices)
+
+    def __contains__(self, name) -> bool:
+        return name in self.slices
+
+    def n_rows(self, name: str) -> int:
+        start, stop = self.slices[name]
+        return len(self.base) + stop - start
+
+    def views(self, name: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        The two parts of a version without copying them.
+
+        Args:
+            name (str): Version name.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: The shared original rows
+            and a slice of the synthetic frame.
+        """
+        start, stop = self.slices[name]
+        return self.base, self.synthetic.iloc[start:stop]
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        # Materialize one version, tagged with its labels and IR when they
+        # are set, in the column order of merge_abalone_df
+        version = pd.concat(self.views(name), ignore_index=True)
+        for column, labels in sorted_labels(self.labels).items():
+            version[column] = label_values(column, labels, name, len(version))
+        if name in self.tags:
+            version["IR"] = self.tags[name]
+        return version
+
+    def items(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        # Versions are materialized one at a time as they are asked for
+        for name in self.slices:
+            yield name, self[name]
+
+    def memory_usage(self) -> int:
+        """
+        Bytes held by the version set.
+
+        Returns:
+            int: Deep memory usage of the shared and synthetic rows.
+        """
+        return int(
+            self.base.memory_usage(deep=True).sum()
+            + self.synthetic.memory_usage(deep=True).sum()
+        )
+
+
+def sorted_labels(labels: Dict[str, Dict[str, object]]) -> dict:
+    # Label columns in LABEL_COLUMNS order, leaving out empty ones
+    return {
+        column: labels[column]
+        for column in LABEL_COLUMNS
+        if labels.get(column)
+    }
+
+
+def label_values(
+    column: str, labels: Dict[str, object], name: str, n_rows: int
+):
+    """
+    Values of one label column for the rows of one version.
+
+    Args:
+        column (str): A LABEL_COLUMNS name.
+        labels (Dict[str, object]): The column's value per version name.
+        name (str): Version name.
+        n_rows (int): Rows of the version.
+
+    Returns:
+        'Kind' as a categorical over every kind of the versions, so each
+        version has the same categories; other labels as their value.
+    """
+    if column != "Kind":
+        return labels[name]
+    categories = list(dict.fromkeys(labels.values()))
+    return pd.Categorical.from_codes(
+        np.full(n_rows, categories.index(labels[name]), dtype=np.int8),
+        categories,
+    )
@@ -0,0 +1,5 @@
+# Values shared by the extract and transform layers, so neither imports
+# the other
+
+# Categories of the Abalone 'Sex' column, in the order they are encoded
+SEX_CATEGORIES = ["F", "I", "M"]
@@ -60,11 +60,18 @@ def setup_logger(name, log_file, level=logging.DEBUG, base_path=None):
     return logger
 
 
-def log_extract_success(logger, type, shape, execution_time, expected_rate):
+def log_extract_success(
+    logger, type, shape, execution_time, expected_rate, chunks=None
+):
     logger.setLevel(logging.INFO)
     logger.info(f"Data extraction successful for {type}!")
     logger.info(f"Extracted {shape[0]} rows " f"and {shape[1]} columns")
     logger.info(f"Execution time: {execution_time} seconds")
+    if chunks is not None and execution_time > 0:
+        logger.info(
+            f"Total throughput over {chunks} chunks: "
+            f"{shape[0] / execution_time:.0f} rows/second"
+        )
 
     if execution_time / shape[0] <= expected_rate:
         logger.info(
@@ -76,3 +83,53 @@ def log_extract_success(logger, type, shape, execution_time, expected_rate):
             f"Execution time per row exceeds {expected_rate}: "
             f"{execution_time / shape[0]} seconds"
         )
+
+
+def log_compression_throughput(
+    logger, compressed_bytes, uncompressed_bytes, execution_time
+):
+    logger.setLevel(logging.INFO)
+    logger.info(
+        f"Read {compressed_bytes} compressed bytes expanding to "
+        f"{uncompressed_bytes} bytes "
+        f"(ratio {uncompressed_bytes / max(compressed_bytes, 1):.2f})"
+    )
+    if execution_time > 0:
+        logger.info(
+            f"Compressed throughput: "
+            f"{compressed_bytes / execution_time / 1e6:.2f} MB/second, "
+            f"uncompressed throughput: "
+            f"{uncompressed_bytes / execution_time / 1e6:.2f} MB/second"
+        )
+
+
+def log_extract_chunk_success(
+    logger, type, chunk_number, shape, execution_time
+):
+    logger.setLevel(logging.INFO)
+    logger.info(
+        f"Extracted chunk {chunk_number} for {type}: "
+        f"{shape[0]} rows and {shape[1]} columns "
+        f"in {execution_time} seconds"
+    )
+    if execution_time > 0:
+        logger.info(
+            f"Chunk {chunk_number} throughput: "
+            f"{shape[0] / execution_time:.0f} rows/second"
+        )
+
+
+def log_resample_success(
+    logger, engine, version, shape, execution_time, peak_memory=None
+):
+    # peak_memory is None unless memory profiling was asked for
+    memory = (
+        "" if peak_memory is None
+        else f", peak memory {peak_memory / 1e6:.1f} MB"
+    )
+    logger.setLevel(logging.INFO)
+    logger.info(
+        f"Resampling with {engine} ({version}): "
+        f"{shape[0]} rows and {shape[1]} columns "
+        f"in {execution_time} seconds{memory}"
+    )
@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from config.db_config import load_db_config, DatabaseConfigError
+from src.extract.extract_query import (
+    copy_extract_query,
+    execute_extract_query,
+)
+from src.utils.db_utils import create_db_engine, DatabaseConnectionError
+
+"""
+Component tests for the COPY-based extraction path.
+
+These run copy_extract_query against the local PostgreSQL test database
+(the target_database from .env.test) and compare the result with the
+row-by-row read_sql_query path on the same table.
+"""
+
+TABLE_NAME = "copy_extract_abalone"
+
+
+@pytest.fixture(scope="module")
+def connection():
+    try:
+        engine = create_db_engine(load_db_config()["target_database"])
+        connection = engine.connect()
+    except (
+        DatabaseConfigError,
+        DatabaseConnectionError,
+        OperationalError,
+    ) as e:
+        pytest.skip(f"PostgreSQL test database not available: {e}")
+
+    abalone_df = pd.read_csv("data/raw/unclean_abalone.csv")
+    abalone_df.columns = abalone_df.columns.str.strip()
+    abalone_df.loc[3, "Sex"] = None
+    abalone_df.to_sql(
+        TABLE_NAME, connection, if_exists="replace", index=False
+    )
+    connection.commit()
+
+    yield connection
+
+    connection.execute(text(f"DROP TABLE IF EXISTS {TABLE_NAME}"))
+    connection.commit()
+    connection.close()
+
+
+def test_copy_extract_matches_read_sql_query(connection):
+    query = f'SELECT * FROM {TABLE_NAME} ORDER BY "Length", "Diameter"'
+
+    copied = copy_extract_query(query, connection)
+    expected = execute_extract_query(query, connection)
+
+    pd.testing.assert_frame_equal(copied, expected, check_dtype=False)
+
+
+def test_copy_extract_preserves_nulls(connection):
+    copied = copy_extract_query(
+        f'SELECT "Sex" FROM {TABLE_NAME} WHERE "Sex" IS NULL', connection
+    )
+
+    assert len(copied) == 1
+    assert copied["Sex"].isna().all()
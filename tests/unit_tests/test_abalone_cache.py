@@ -0,0 +1,82 @@
+import shutil
+import pandas as pd
+import pytest
+from src.extract import abalone_cache
+from src.extract import read_abalone_csv as abalone_reader
+from src.extract.abalone_cache import (
+    cache_path,
+    file_content_hash,
+    read_abalone_csv_cached,
+)
+from src.extract.extract_abalone import FILE_PATH
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    path = tmp_path / "unclean_abalone.csv"
+    shutil.copy(FILE_PATH, path)
+    return str(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def test_file_content_hash_depends_only_on_content(raw_file, tmp_path):
+    copy = tmp_path / "renamed.csv"
+    shutil.copy(raw_file, copy)
+
+    assert file_content_hash(raw_file) == file_content_hash(str(copy))
+
+
+def test_cache_miss_then_hit(raw_file, cache_dir, mocker):
+    first = read_abalone_csv_cached(raw_file, cache_dir)
+    spy = mocker.spy(abalone_reader, "read_abalone_csv")
+
+    second = read_abalone_csv_cached(raw_file, cache_dir)
+
+    spy.assert_not_called()
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(
+        second, abalone_reader.read_abalone_csv(raw_file)
+    )
+
+
+def test_cache_invalidates_when_file_changes(raw_file, cache_dir):
+    read_abalone_csv_cached(raw_file, cache_dir)
+    original_entry = cache_path(raw_file, cache_dir)
+
+    with open(raw_file, "a") as file:
+        file.write("M,0.5,0.4,0.1,0.5,0.2,0.1,0.15,positive\n")
+
+    assert cache_path(raw_file, cache_dir) != original_entry
+    assert len(read_abalone_csv_cached(raw_file, cache_dir)) == (
+        len(pd.read_feather(original_entry)) + 1
+    )
+
+
+def test_cache_invalidates_when_schema_changes(raw_file, cache_dir, mocker):
+    original_entry = cache_path(raw_file, cache_dir)
+
+    mocker.patch.object(
+        abalone_reader, "SCHEMA_VERSION", abalone_reader.SCHEMA_VERSION + 1
+    )
+
+    assert cache_path(raw_file, cache_dir) != original_entry
+    fingerprint = abalone_cache.schema_fingerprint()
+    assert fingerprint in cache_path(raw_file, cache_dir)
+
+
+def test_cache_hit_applies_projection_and_filters(raw_file, cache_dir):
+    filters = [("Sex", "==", "I")]
+    miss = read_abalone_csv_cached(
+        raw_file, cache_dir, columns=["Diameter"], filters=filters
+    )
+
+    hit = read_abalone_csv_cached(
+        raw_file, cache_dir, columns=["Diameter"], filters=filters
+    )
+
+    assert hit.columns.tolist() == ["Diameter"]
+    assert hit["Diameter"].tolist() == miss["Diameter"].tolist()
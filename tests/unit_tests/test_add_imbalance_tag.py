@@ -0,0 +1,40 @@
+import pandas as pd
+from src.transform.add_imbalance_tag import add_tag_to_data_versions
+
+
+def make_versions():
+    return {
+        f"abalone_df_{ratio}": pd.DataFrame({"Class": [0, 1]})
+        for ratio in (5, 10, 15)
+    }
+
+
+def test_add_tag_to_data_versions_tags_dict_in_order():
+    tagged = add_tag_to_data_versions(make_versions())
+
+    assert [df["IR"].iloc[0] for df in tagged.values()] == [5, 10, 15]
+
+
+def test_add_tag_to_data_versions_tags_a_stream_lazily():
+    consumed = []
+
+    def versions():
+        for name, df in make_versions().items():
+            consumed.append(name)
+            yield name, df
+
+    tagged = add_tag_to_data_versions(versions())
+    assert consumed == []
+
+    name, df = next(tagged)
+    assert (name, df["IR"].iloc[0]) == ("abalone_df_5", 5)
+    assert consumed == ["abalone_df_5"]
+    assert [df["IR"].iloc[0] for _, df in tagged] == [10, 15]
+
+
+def test_add_tag_to_data_versions_uses_given_tags():
+    tags = {"abalone_df_5": 50, "abalone_df_10": 20, "abalone_df_15": 5}
+
+    tagged = add_tag_to_data_versions(make_versions(), tags=tags)
+
+    assert {name: df["IR"].iloc[0] for name, df in tagged.items()} == tags
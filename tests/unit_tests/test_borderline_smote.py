@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.transform.borderline_smote import (
+    fit_borderline_neighbours,
+    resample_from_neighbours,
+    sample_borderline_replicates,
+)
+from src.transform.resample_abalone import resample_with_borderline_smote
+from src.transform.standardize_encode_abalone import standardize_and_encode
+
+
+@pytest.fixture(scope="module")
+def abalone_xy():
+    encoded = standardize_and_encode(pd.read_csv(FILE_PATH))
+    return encoded.drop(columns=["Class"]), encoded["Class"]
+
+
+@pytest.mark.parametrize("kind", ["borderline-1", "borderline-2"])
+def test_shared_neighbours_match_imblearn_for_every_ratio(abalone_xy, kind):
+    X, y = abalone_xy
+    graph = fit_borderline_neighbours(X, y, kind=kind)
+
+    for ratio in (0.05, 0.5, 1.0):
+        expected = resample_with_borderline_smote(
+            X, y, ratio, kind=kind, random_state=7
+        )
+        result = resample_from_neighbours(graph, ratio, random_state=7)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_resample_from_neighbours_keeps_data_at_or_below_current_ratio(
+    abalone_xy,
+):
+    X, y = abalone_xy
+    graph = fit_borderline_neighbours(X, y)
+    expected = X.assign(Class=y)
+
+    for ratio in (0.001, (y == 1).sum() / (y == 0).sum()):
+        result = resample_from_neighbours(graph, ratio)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_fit_borderline_neighbours_rejects_unknown_kind(abalone_xy):
+    with pytest.raises(ValueError, match="kind must be one of"):
+        fit_borderline_neighbours(*abalone_xy, kind="svm")
+
+
+@pytest.mark.parametrize("kind", ["borderline-1", "borderline-2"])
+def test_float32_engine_stays_close_to_float64(abalone_xy, kind):
+    X, y = abalone_xy
+    expected = resample_from_neighbours(
+        fit_borderline_neighbours(X, y, kind=kind), 0.5
+    )
+
+    result = resample_from_neighbours(
+        fit_borderline_neighbours(X, y, kind=kind, dtype=np.float32), 0.5
+    )
+
+    assert (result.dtypes[X.columns] == np.float32).all()
+    assert result["Class"].dtype == expected["Class"].dtype
+    np.testing.assert_allclose(
+        result.to_numpy(dtype=np.float64),
+        expected.to_numpy(dtype=np.float64),
+        atol=1e-5,
+    )
+
+
+@pytest.mark.parametrize("kind", ["borderline-1", "borderline-2"])
+def test_replicates_are_distinct_and_reproducible(abalone_xy, kind):
+    graph = fit_borderline_neighbours(*abalone_xy, kind=kind)
+
+    replicates = sample_borderline_replicates(graph, 500, 4, random_state=3)
+
+    assert replicates.shape == (4, 500, graph["X"].shape[1])
+    np.testing.assert_array_equal(
+        replicates, sample_borderline_replicates(graph, 500, 4, 3)
+    )
+    assert not np.array_equal(replicates[0], replicates[1])
+    # Interpolated samples stay within the range of the rows they join
+    assert (replicates >= graph["sample_from"].min(axis=0)).all()
+    assert (replicates <= graph["sample_from"].max(axis=0)).all()
@@ -0,0 +1,137 @@
+import bz2
+import gzip
+import pandas as pd
+import pyarrow as pa
+import pytest
+from src.extract import extract_abalone as extract_abalone_module
+from src.extract.compressed_input import (
+    CountingReader,
+    detect_compression,
+    open_raw_input,
+    raw_input,
+)
+from src.extract.extract_abalone import FILE_PATH
+from src.extract.read_abalone_csv import read_abalone_csv
+
+
+def write_compressed(path, compression):
+    with open(FILE_PATH, "rb") as file:
+        data = file.read()
+    if compression == "gzip":
+        path.write_bytes(gzip.compress(data))
+    elif compression == "bz2":
+        path.write_bytes(bz2.compress(data))
+    else:
+        with pa.CompressedOutputStream(str(path), compression) as out:
+            out.write(data)
+    return str(path)
+
+
+@pytest.fixture(params=["gzip", "zstd", "bz2"])
+def compressed_file(request, tmp_path):
+    # No extension on purpose - detection goes by content
+    return request.param, write_compressed(
+        tmp_path / "abalone_drop", request.param
+    )
+
+
+def test_detect_compression(compressed_file):
+    compression, path = compressed_file
+
+    assert detect_compression(path) == compression
+    assert detect_compression(FILE_PATH) is None
+
+
+def test_open_raw_input_returns_path_when_uncompressed():
+    assert open_raw_input(FILE_PATH) == FILE_PATH
+
+
+def test_counting_reader_counts_uncompressed_bytes(compressed_file):
+    _, path = compressed_file
+    reader = open_raw_input(path)
+
+    with open(FILE_PATH, "rb") as file:
+        expected = file.read()
+
+    assert isinstance(reader, CountingReader)
+    assert reader.read() == expected
+    assert reader.bytes_read == len(expected)
+
+
+def test_read_abalone_csv_decompresses(compressed_file):
+    _, path = compressed_file
+
+    pd.testing.assert_frame_equal(
+        read_abalone_csv(path), read_abalone_csv(FILE_PATH)
+    )
+
+
+@pytest.mark.parametrize("chunksize", [None, 1000])
+def test_extract_abalone_reports_compression_throughput(
+    mocker, tmp_path, chunksize
+):
+    path = write_compressed(tmp_path / "abalone.csv.gz", "gzip")
+    mocker.patch.object(extract_abalone_module, "FILE_PATH", path)
+    mocker.patch.object(extract_abalone_module, "log_extract_success")
+    mocker.patch.object(extract_abalone_module, "log_extract_chunk_success")
+    mock_log = mocker.patch.object(
+        extract_abalone_module, "log_compression_throughput"
+    )
+
+    result = extract_abalone_module.extract_abalone(chunksize=chunksize)
+    if chunksize:
+        result = pd.concat(result, ignore_index=True)
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(FILE_PATH))
+    _, compressed_bytes, uncompressed_bytes, _ = mock_log.call_args[0]
+    assert compressed_bytes == (tmp_path / "abalone.csv.gz").stat().st_size
+    assert uncompressed_bytes == len(open(FILE_PATH, "rb").read())
+
+
+def test_extract_abalone_compressed_input_ignores_byte_ranges(
+    mocker, tmp_path
+):
+    path = tmp_path / "abalone.csv.zst"
+    write_compressed(path, "zstd")
+    mocker.patch.object(extract_abalone_module, "FILE_PATH", str(path))
+    mock_ranges = mocker.patch.object(
+        extract_abalone_module, "read_abalone_csv_ranges"
+    )
+
+    df = extract_abalone_module.extract_abalone(typed=True, workers=4)
+
+    mock_ranges.assert_not_called()
+    pd.testing.assert_frame_equal(df, read_abalone_csv(FILE_PATH))
+
+
+def test_compressed_input_writes_no_uncompressed_copy(tmp_path):
+    path = write_compressed(tmp_path / "abalone.csv.gz", "gzip")
+
+    read_abalone_csv(path)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["abalone.csv.gz"]
+
+
+def test_raw_input_closes_the_reader_on_error(compressed_file):
+    _, path = compressed_file
+
+    with pytest.raises(RuntimeError):
+        with raw_input(path) as reader:
+            raise RuntimeError("parse failed")
+
+    assert reader.closed
+
+
+@pytest.mark.parametrize("chunksize", [None, 1000])
+def test_extract_abalone_closes_compressed_input(mocker, tmp_path, chunksize):
+    path = write_compressed(tmp_path / "abalone.csv.gz", "gzip")
+    mocker.patch.object(extract_abalone_module, "FILE_PATH", path)
+    close = mocker.spy(CountingReader, "close")
+
+    result = extract_abalone_module.extract_abalone(chunksize=chunksize)
+    if chunksize:
+        # A consumer that stops early still releases the file
+        next(result)
+        result.close()
+
+    assert close.call_count >= 1
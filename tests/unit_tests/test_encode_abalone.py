@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.extract.read_abalone_csv import read_abalone_csv
+from src.transform.encode_abalone import (
+    category_codes,
+    encode_abalone,
+    encode_abalone_native,
+    one_hot_encode,
+)
+
+
+@pytest.fixture
+def abalone_df():
+    return pd.read_csv(FILE_PATH)
+
+
+def test_encode_abalone_native_matches_sklearn_encoding(abalone_df):
+    expected = encode_abalone(abalone_df)
+
+    result = encode_abalone_native(abalone_df)
+
+    assert (result[["Sex_F", "Sex_I", "Sex_M"]].dtypes == np.uint8).all()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_encode_abalone_native_on_typed_frame():
+    typed_df = read_abalone_csv(FILE_PATH)
+
+    result = encode_abalone_native(typed_df)
+
+    assert result.columns.tolist()[-4:] == ["Sex_F", "Sex_I", "Sex_M", "Class"]
+    assert (result[["Sex_F", "Sex_I", "Sex_M"]].sum(axis=1) == 1).all()
+
+
+def test_one_hot_encode_keeps_vocabulary_stable():
+    column = pd.Series(["M", "M"], name="Sex")
+
+    result = one_hot_encode(column, ["F", "I", "M"])
+
+    assert result.columns.tolist() == ["Sex_F", "Sex_I", "Sex_M"]
+    assert result.to_numpy().tolist() == [[0, 0, 1], [0, 0, 1]]
+
+
+def test_one_hot_encode_unknown_category_policies():
+    column = pd.Series(["F", "X", None], name="Sex")
+
+    with pytest.raises(ValueError, match="Unknown 'Sex' categories"):
+        one_hot_encode(column, ["F", "I", "M"])
+
+    result = one_hot_encode(column, ["F", "I", "M"], handle_unknown="ignore")
+    assert result.to_numpy().tolist() == [[1, 0, 0], [0, 0, 0], [0, 0, 0]]
+
+
+def test_category_codes_reuses_matching_categorical_codes():
+    column = pd.Series(
+        pd.Categorical(["I", "F"], categories=["F", "I", "M"]), name="Sex"
+    )
+
+    assert category_codes(column, ["F", "I", "M"]).tolist() == [1, 0]
+    assert category_codes(column, ["M", "I"], "ignore").tolist() == [1, -1]
+
+
+def test_category_codes_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        category_codes(pd.Series(["F"], name="Sex"), ["F"], "drop")
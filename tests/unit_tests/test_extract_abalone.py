@@ -0,0 +1,117 @@
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import (
+    extract_abalone,
+    stream_abalone,
+    TYPE,
+    FILE_PATH,
+    EXPECTED_PERFORMANCE,
+)
+
+
+@pytest.fixture
+def mock_log_extract_success(mocker):
+    return mocker.patch("src.extract.extract_abalone.log_extract_success")
+
+
+@pytest.fixture
+def mock_log_extract_chunk_success(mocker):
+    return mocker.patch(
+        "src.extract.extract_abalone.log_extract_chunk_success"
+    )
+
+
+@pytest.fixture
+def mock_logger(mocker):
+    return mocker.patch("src.extract.extract_abalone.logger")
+
+
+def test_extract_abalone_csv_to_dataframe(mocker, mock_log_extract_success):
+    mock_df = pd.DataFrame({"Sex": ["M", "F"], "Class": ["negative"] * 2})
+    mocker.patch(
+        "src.extract.extract_abalone.pd.read_csv", return_value=mock_df
+    )
+
+    df = extract_abalone()
+
+    assert isinstance(df, pd.DataFrame)
+    pd.testing.assert_frame_equal(df, mock_df)
+
+
+def test_extract_abalone_chunked_matches_full_read(
+    mock_log_extract_success, mock_log_extract_chunk_success
+):
+    full_df = pd.read_csv(FILE_PATH)
+
+    chunks = list(extract_abalone(chunksize=1000))
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [1000] * (
+        len(chunks) - 1
+    )
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), full_df
+    )
+
+
+def test_stream_abalone_logs_each_chunk_and_total(
+    mock_logger, mock_log_extract_success, mock_log_extract_chunk_success
+):
+    rows = len(pd.read_csv(FILE_PATH))
+
+    chunks = list(stream_abalone(2000))
+
+    assert mock_log_extract_chunk_success.call_count == len(chunks)
+    mock_log_extract_success.assert_called_once()
+    args, kwargs = mock_log_extract_success.call_args
+    assert args[1] == TYPE
+    assert args[2] == (rows, chunks[0].shape[1])
+    assert args[4] == EXPECTED_PERFORMANCE
+    assert kwargs["chunks"] == len(chunks)
+
+
+def test_stream_abalone_rejects_invalid_chunksize():
+    with pytest.raises(ValueError):
+        next(stream_abalone(0))
+
+
+def test_stream_abalone_error(mocker, mock_logger):
+    mocker.patch(
+        "src.extract.extract_abalone.pd.read_csv",
+        side_effect=Exception("boom"),
+    )
+
+    with pytest.raises(
+        Exception, match=f"Failed to load CSV file: {FILE_PATH}"
+    ):
+        list(stream_abalone(10))
+
+    mock_logger.error.assert_called_once_with(
+        f"Error loading {FILE_PATH}: boom"
+    )
+
+
+def test_extract_abalone_typed_chunks_match_typed_read(
+    mock_log_extract_success, mock_log_extract_chunk_success
+):
+    typed_df = extract_abalone(typed=True)
+
+    chunks = extract_abalone(chunksize=1500, typed=True)
+
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), typed_df
+    )
+
+
+def test_extract_abalone_cache_requires_typed():
+    with pytest.raises(ValueError):
+        extract_abalone(use_cache=True)
+
+
+def test_extract_abalone_cache_rejects_workers():
+    with pytest.raises(ValueError, match="workers"):
+        extract_abalone(typed=True, use_cache=True, workers=4)
+
+
+def test_extract_abalone_parallel_requires_typed():
+    with pytest.raises(ValueError):
+        extract_abalone(workers=4)
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.extract.extract_abalone_files import (
+    extract_abalone_files,
+    resolve_raw_files,
+)
+from src.extract.read_abalone_csv import read_abalone_csv
+
+
+@pytest.fixture
+def shard_dir(tmp_path):
+    raw_df = pd.read_csv(FILE_PATH)
+    # Written out of name order to check the result follows sorted names
+    for day, (start, stop) in [
+        ("2025-01-03", (3000, len(raw_df))),
+        ("2025-01-01", (0, 1000)),
+        ("2025-01-02", (1000, 3000)),
+    ]:
+        raw_df.iloc[start:stop].to_csv(
+            tmp_path / f"abalone_{day}.csv", index=False
+        )
+    return tmp_path
+
+
+@pytest.fixture
+def mock_logger(mocker):
+    return mocker.patch("src.extract.extract_abalone_files.logger")
+
+
+def test_resolve_raw_files_from_directory_and_glob(shard_dir):
+    expected = [
+        str(shard_dir / f"abalone_2025-01-0{day}.csv") for day in (1, 2, 3)
+    ]
+
+    assert resolve_raw_files(str(shard_dir)) == expected
+    assert resolve_raw_files(str(shard_dir / "abalone_*.csv")) == expected
+
+
+def test_resolve_raw_files_without_matches(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        resolve_raw_files(str(tmp_path / "*.csv"))
+
+
+def test_extract_abalone_files_matches_single_file(shard_dir, mock_logger):
+    df = extract_abalone_files(str(shard_dir), workers=2)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(FILE_PATH))
+
+
+def test_extract_abalone_files_typed(shard_dir, mock_logger):
+    df = extract_abalone_files(str(shard_dir), workers=2, typed=True)
+
+    pd.testing.assert_frame_equal(df, read_abalone_csv(FILE_PATH))
+
+
+def test_extract_abalone_files_reports_each_file(shard_dir, mock_logger):
+    extract_abalone_files(str(shard_dir), workers=2)
+
+    logged = [args[0] for args, _ in mock_logger.info.call_args_list]
+    assert logged[0].startswith(
+        f"Extracted 1000 rows from {shard_dir / 'abalone_2025-01-01.csv'}"
+    )
+    assert logged[1].startswith(
+        f"Extracted 2000 rows from {shard_dir / 'abalone_2025-01-02.csv'}"
+    )
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.extract.extract_abalone_ranges import (
+    compute_byte_ranges,
+    read_abalone_csv_ranges,
+)
+from src.extract.read_abalone_csv import read_abalone_csv
+
+
+@pytest.mark.parametrize("n_ranges", [1, 2, 3, 7, 16])
+def test_compute_byte_ranges_are_newline_aligned(n_ranges):
+    with open(FILE_PATH, "rb") as file:
+        content = file.read()
+
+    byte_ranges = compute_byte_ranges(FILE_PATH, n_ranges)
+
+    assert len(byte_ranges) == n_ranges
+    assert byte_ranges[0][0] == content.index(b"\n") + 1
+    assert byte_ranges[-1][1] == len(content)
+    for (_, end), (next_start, _) in zip(byte_ranges, byte_ranges[1:]):
+        assert end == next_start
+        assert content[end - 1:end] == b"\n"
+
+
+def test_compute_byte_ranges_with_more_ranges_than_rows(tmp_path):
+    path = tmp_path / "tiny.csv"
+    path.write_bytes(b"a,b\n1,2\n3,4\n")
+
+    byte_ranges = compute_byte_ranges(str(path), 10)
+
+    assert byte_ranges[0][0] == 4
+    assert byte_ranges[-1][1] == 12
+    assert len(byte_ranges) <= 2
+
+
+def test_compute_byte_ranges_rejects_invalid_count():
+    with pytest.raises(ValueError):
+        compute_byte_ranges(FILE_PATH, 0)
+
+
+@pytest.mark.parametrize("workers", [2, 5])
+def test_read_abalone_csv_ranges_matches_serial_parse(workers):
+    df = read_abalone_csv_ranges(FILE_PATH, workers)
+
+    pd.testing.assert_frame_equal(df, read_abalone_csv(FILE_PATH))
+
+
+def test_read_abalone_csv_ranges_with_filters():
+    filters = [("Sex", "!=", "I")]
+
+    df = read_abalone_csv_ranges(
+        FILE_PATH, 3, columns=["Sex", "Class"], filters=filters
+    )
+
+    pd.testing.assert_frame_equal(
+        df,
+        read_abalone_csv(FILE_PATH, columns=["Sex", "Class"], filters=filters),
+    )
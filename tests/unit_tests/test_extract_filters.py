@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from sqlalchemy import create_engine
+from src.extract.extract_filters import (
+    build_projected_query,
+    filter_arrow_table,
+    filter_dataframe,
+    required_columns,
+    validate_filters,
+)
+from src.extract.extract_query import execute_projected_query
+
+FILTERS = [("Sex", "in", ["M", "F"]), ("Length", ">", 0.5)]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "Sex": ["M", "F", "I", "M"],
+            "Length": [0.6, 0.4, 0.7, 0.55],
+            "Class": [0, 1, 0, 1],
+        }
+    )
+
+
+def test_validate_filters_rejects_bad_specs():
+    with pytest.raises(ValueError):
+        validate_filters([("Sex", "like", "M")])
+    with pytest.raises(ValueError):
+        validate_filters([("Sex", "in", "M")])
+    with pytest.raises(ValueError):
+        validate_filters([("Sex", "in", [])])
+    with pytest.raises(ValueError):
+        validate_filters([("Sex", "==")])
+
+
+def test_required_columns_adds_filter_columns():
+    assert required_columns(["Class"], FILTERS) == ["Class", "Sex", "Length"]
+    assert required_columns(["Length"], FILTERS) == ["Length", "Sex"]
+    assert required_columns(None, FILTERS) is None
+
+
+def test_filter_dataframe(df):
+    result = filter_dataframe(df, ["Class"], FILTERS)
+
+    assert result.columns.tolist() == ["Class"]
+    assert result.index.tolist() == [0, 3]
+
+
+def test_filter_arrow_table_matches_dataframe(df):
+    table = pa.Table.from_pandas(df)
+
+    result = filter_arrow_table(table, ["Class"], FILTERS)
+
+    assert result.column_names == ["Class"]
+    assert result["Class"].to_pylist() == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "op, value, expected",
+    [(">", 0.2, [1]), ("==", 0.2, [0]), ("<=", 0.2, [0, 2]),
+     ("in", [0.2, 0.1], [0, 2])],
+)
+def test_float32_filters_agree_on_arrow_and_pandas(op, value, expected):
+    df = pd.DataFrame(
+        {"Diameter": np.array([0.2, 0.3, 0.1], dtype=np.float32)}
+    )
+    filters = [("Diameter", op, value)]
+
+    table = filter_arrow_table(
+        pa.Table.from_pandas(df, preserve_index=True), None, filters
+    )
+
+    assert filter_dataframe(df, None, filters).index.tolist() == expected
+    assert table.to_pandas().index.tolist() == expected
+
+
+def test_build_projected_query():
+    query, params = build_projected_query(
+        "SELECT * FROM abalone;", ["Length"], FILTERS
+    )
+
+    assert query == (
+        'SELECT "Length" FROM (SELECT * FROM abalone) AS projected_source '
+        'WHERE "Sex" IN (:filter_0_0, :filter_0_1) AND "Length" > :filter_1'
+    )
+    assert params == {"filter_0_0": "M", "filter_0_1": "F", "filter_1": 0.5}
+
+
+def test_execute_projected_query(df):
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        df.to_sql("abalone", connection, index=False)
+
+        result = execute_projected_query(
+            "SELECT * FROM abalone", connection, ["Class"], FILTERS
+        )
+
+    assert result["Class"].tolist() == [0, 1]
+
+
+def test_build_projected_query_binds_python_values():
+    _, params = build_projected_query(
+        "SELECT * FROM abalone", None, [("Length", ">", np.float32(0.5))]
+    )
+
+    assert type(params["filter_0"]) is float
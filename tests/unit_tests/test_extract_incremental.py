@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from src.extract.extract_incremental import (
+    build_incremental_query,
+    extract_incremental,
+    load_watermark,
+    save_watermark,
+    watermark_key,
+)
+
+QUERY = "SELECT * FROM transactions;"
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "state" / "watermarks.json")
+
+
+@pytest.fixture
+def sqlite_connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        pd.DataFrame({"id": range(1, 11), "amount": range(10)}).to_sql(
+            "transactions", connection, index=False
+        )
+        yield connection
+
+
+def append_rows(connection, ids):
+    pd.DataFrame({"id": ids, "amount": [0] * len(ids)}).to_sql(
+        "transactions", connection, index=False, if_exists="append"
+    )
+
+
+def test_watermark_round_trip(state_path):
+    save_watermark("numeric", 42, state_path)
+    save_watermark("timestamp", pd.Timestamp("2025-01-02 03:04"), state_path)
+
+    assert load_watermark("numeric", state_path) == 42
+    assert load_watermark("timestamp", state_path) == pd.Timestamp(
+        "2025-01-02 03:04"
+    )
+    assert load_watermark("unknown", state_path) is None
+
+
+def test_watermark_key_ignores_whitespace():
+    assert watermark_key("SELECT *\n FROM t") == watermark_key(
+        "SELECT * FROM t"
+    )
+
+
+def test_build_incremental_query():
+    assert str(build_incremental_query(QUERY, "id", None)) == (
+        "SELECT * FROM transactions"
+    )
+    assert str(build_incremental_query(QUERY, "id", 10)) == (
+        "SELECT * FROM (SELECT * FROM transactions) AS incremental_source "
+        'WHERE "id" > :watermark ORDER BY "id"'
+    )
+
+
+def test_extract_incremental_only_returns_new_rows(
+    sqlite_connection, state_path
+):
+    first = extract_incremental(
+        QUERY, sqlite_connection, "id", state_path=state_path
+    )
+    append_rows(sqlite_connection, [11, 12, 13])
+    second = extract_incremental(
+        QUERY, sqlite_connection, "id", state_path=state_path
+    )
+    third = extract_incremental(
+        QUERY, sqlite_connection, "id", state_path=state_path
+    )
+
+    assert first["id"].tolist() == list(range(1, 11))
+    assert second["id"].tolist() == [11, 12, 13]
+    assert third.empty
+    assert load_watermark(watermark_key(QUERY), state_path) == 13
+
+
+def test_extract_incremental_without_commit(sqlite_connection, state_path):
+    extract_incremental(
+        QUERY,
+        sqlite_connection,
+        "id",
+        key="transactions",
+        state_path=state_path,
+        commit_watermark=False,
+    )
+
+    assert load_watermark("transactions", state_path) is None
@@ -1,7 +1,12 @@
 import pytest
 import pandas as pd
 from unittest.mock import MagicMock, call
-from src.extract.extract_query import execute_extract_query
+from sqlalchemy import create_engine
+from src.extract.extract_query import (
+    execute_extract_query,
+    stream_extract_query,
+    copy_extract_query,
+)
 from src.utils.db_utils import QueryExecutionError
 
 
@@ -53,3 +58,132 @@ def test_execute_extract_query_invalid_query_logging(mocker):
             call(f"The query that failed was: {query}"),
         ]
     )
+
+
+@pytest.fixture
+def sqlite_connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        pd.DataFrame({"id": range(25), "value": range(100, 125)}).to_sql(
+            "transactions", connection, index=False
+        )
+        yield connection
+
+
+def test_stream_extract_query_yields_batches(sqlite_connection):
+    batches = list(
+        stream_extract_query(
+            "SELECT * FROM transactions", sqlite_connection, batch_size=10
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert pd.concat(batches, ignore_index=True)["id"].tolist() == list(
+        range(25)
+    )
+
+
+def test_stream_extract_query_uses_server_side_cursor(mocker):
+    mock_read_sql_query = mocker.patch(
+        "pandas.read_sql_query", return_value=iter([])
+    )
+    mock_connection = MagicMock()
+    query = "SELECT * FROM transactions"
+
+    list(stream_extract_query(query, mock_connection, batch_size=500))
+
+    mock_connection.execution_options.assert_called_once_with(
+        stream_results=True, max_row_buffer=500
+    )
+    mock_read_sql_query.assert_called_once_with(
+        query,
+        mock_connection.execution_options.return_value,
+        chunksize=500,
+    )
+
+
+def test_stream_extract_query_logs_batch_timings(mocker, sqlite_connection):
+    mock_logger = mocker.patch("src.extract.extract_query.logger")
+
+    list(
+        stream_extract_query(
+            "SELECT * FROM transactions", sqlite_connection, batch_size=20
+        )
+    )
+
+    logged = [args[0] for args, _ in mock_logger.info.call_args_list]
+    assert logged[0].startswith("Fetched batch 1: 20 rows in ")
+    assert logged[1].startswith("Fetched batch 2: 5 rows in ")
+    assert logged[2].startswith("Streamed 25 rows in 2 batches in ")
+
+
+def test_stream_extract_query_invalid_query(mocker, sqlite_connection):
+    mock_logger = mocker.patch("src.extract.extract_query.logger")
+    query = "SELECT unrecognized_column FROM transactions"
+
+    with pytest.raises(QueryExecutionError):
+        list(stream_extract_query(query, sqlite_connection))
+
+    mock_logger.error.assert_any_call(f"The query that failed was: {query}")
+
+
+COPY_CSV = b"id,name,amount\n1,Alice,10.5\n2,,\n3,Charlie,7.25\n"
+
+
+class FakeDbapiError(Exception):
+    pass
+
+
+def mock_copy_connection(cursor):
+    connection = MagicMock()
+    connection.dialect.loaded_dbapi.Error = FakeDbapiError
+    connection.connection.driver_connection.cursor.return_value = cursor
+    return connection
+
+
+def test_copy_extract_query_streams_psycopg3_copy_blocks():
+    cursor = MagicMock()
+    copy = cursor.copy.return_value.__enter__.return_value
+    copy.read.side_effect = [
+        COPY_CSV[:13],
+        COPY_CSV[13:30],
+        COPY_CSV[30:],
+        b"",
+    ]
+    connection = mock_copy_connection(cursor)
+
+    df = copy_extract_query("SELECT * FROM transactions;", connection)
+
+    cursor.copy.assert_called_once_with(
+        "COPY (SELECT * FROM transactions) "
+        "TO STDOUT WITH (FORMAT csv, HEADER true)"
+    )
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["name"].isna().tolist() == [False, True, False]
+    assert df["amount"].isna().tolist() == [False, True, False]
+    cursor.close.assert_called_once()
+
+
+def test_copy_extract_query_falls_back_to_psycopg2_copy_expert():
+    cursor = MagicMock(spec=["copy_expert", "close"])
+    cursor.copy_expert.side_effect = lambda sql, file: file.write(COPY_CSV)
+    connection = mock_copy_connection(cursor)
+
+    df = copy_extract_query("SELECT * FROM transactions", connection)
+
+    assert df.shape == (3, 3)
+    assert df["name"].tolist()[0] == "Alice"
+
+
+def test_copy_extract_query_invalid_query(mocker):
+    mock_logger = mocker.patch("src.extract.extract_query.logger")
+    cursor = MagicMock()
+    cursor.copy.side_effect = FakeDbapiError("column does not exist")
+    connection = mock_copy_connection(cursor)
+    query = "SELECT unrecognized_column FROM transactions"
+
+    with pytest.raises(QueryExecutionError):
+        copy_extract_query(query, connection)
+
+    mock_logger.error.assert_any_call(f"The query that failed was: {query}")
+    cursor.close.assert_called_once()
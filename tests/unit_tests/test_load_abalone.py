@@ -0,0 +1,54 @@
+from unittest.mock import patch
+import pandas as pd
+import pytest
+from src.load.load_abalone import load_abalone_to_db
+
+
+@patch("src.load.load_abalone.create_engine")
+@patch("pandas.DataFrame.to_sql")
+def test_load_abalone_to_db_replaces_table_with_a_frame(
+    mock_to_sql, mock_create_engine
+):
+    load_abalone_to_db(pd.DataFrame({"Class": [0, 1]}))
+
+    mock_to_sql.assert_called_once()
+    assert mock_to_sql.call_args.kwargs["if_exists"] == "replace"
+
+
+@patch("src.load.load_abalone.create_engine")
+@patch("pandas.DataFrame.to_sql")
+def test_load_abalone_to_db_appends_streamed_versions(
+    mock_to_sql, mock_create_engine
+):
+    versions = (
+        (f"abalone_df_{ratio}", pd.DataFrame({"IR": [ratio]}))
+        for ratio in (5, 10, 15)
+    )
+
+    load_abalone_to_db(versions)
+
+    calls = mock_to_sql.call_args_list
+    if_exists = [call.kwargs["if_exists"] for call in calls]
+    assert if_exists == ["replace", "append", "append"]
+    mock_create_engine.assert_called_once()
+
+
+@patch("src.load.load_abalone.create_engine")
+@patch("pandas.DataFrame.to_sql")
+def test_load_abalone_to_db_writes_streamed_versions_in_one_transaction(
+    mock_to_sql, mock_create_engine
+):
+    begin = mock_create_engine.return_value.begin
+
+    def versions():
+        yield "abalone_df_5", pd.DataFrame({"IR": [5]})
+        raise RuntimeError("resampling failed")
+
+    with pytest.raises(RuntimeError, match="resampling failed"):
+        load_abalone_to_db(versions())
+
+    connection = begin.return_value.__enter__.return_value
+    assert mock_to_sql.call_args.args[1] is connection
+    # The transaction is left with the error, so it is rolled back
+    exit_args = begin.return_value.__exit__.call_args.args
+    assert exit_args[0] is RuntimeError
@@ -9,6 +9,9 @@ from src.utils.logging_utils import (
     _create_handlers,
     setup_logger,
     log_extract_success,
+    log_extract_chunk_success,
+    log_compression_throughput,
+    log_resample_success,
 )
 
 
@@ -96,3 +99,70 @@ def test_log_extract_success_exceeds_expected_rate():
     mock_logger.warning.assert_called_once_with(
         "Execution time per row exceeds 0.01: 0.05 seconds"
     )
+
+
+def test_log_extract_success_reports_total_throughput_for_chunks():
+    mock_logger = MagicMock()
+
+    log_extract_success(
+        mock_logger, "chunked_data", (1000, 5), 2.0, 0.01, chunks=4
+    )
+
+    assert mock_logger.info.call_count == 5
+    mock_logger.info.assert_any_call(
+        "Total throughput over 4 chunks: 500 rows/second"
+    )
+
+
+def test_log_extract_chunk_success_reports_throughput():
+    mock_logger = MagicMock()
+
+    log_extract_chunk_success(mock_logger, "chunked_data", 2, (250, 9), 0.5)
+
+    mock_logger.setLevel.assert_called_with(logging.INFO)
+    mock_logger.info.assert_any_call(
+        "Extracted chunk 2 for chunked_data: 250 rows and 9 columns "
+        "in 0.5 seconds"
+    )
+    mock_logger.info.assert_any_call("Chunk 2 throughput: 500 rows/second")
+
+
+def test_log_compression_throughput():
+    mock_logger = MagicMock()
+
+    log_compression_throughput(mock_logger, 1_000_000, 4_000_000, 0.5)
+
+    mock_logger.info.assert_any_call(
+        "Read 1000000 compressed bytes expanding to 4000000 bytes "
+        "(ratio 4.00)"
+    )
+    mock_logger.info.assert_any_call(
+        "Compressed throughput: 2.00 MB/second, "
+        "uncompressed throughput: 8.00 MB/second"
+    )
+
+
+def test_log_resample_success():
+    mock_logger = MagicMock()
+
+    log_resample_success(
+        mock_logger, "smote", "abalone_df_50", (120, 11), 0.25, 2_500_000
+    )
+
+    mock_logger.info.assert_called_once_with(
+        "Resampling with smote (abalone_df_50): 120 rows and 11 columns "
+        "in 0.25 seconds, peak memory 2.5 MB"
+    )
+
+
+def test_log_resample_success_without_memory_profile():
+    mock_logger = MagicMock()
+
+    log_resample_success(
+        mock_logger, "smote", "abalone_df_50", (120, 11), 0.25, None
+    )
+
+    mock_logger.info.assert_called_once_with(
+        "Resampling with smote (abalone_df_50): 120 rows and 11 columns "
+        "in 0.25 seconds"
+    )
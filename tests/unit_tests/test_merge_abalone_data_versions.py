@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.transform.add_imbalance_tag import add_tag_to_data_versions
+from src.transform.merge_abalone_data_versions import merge_abalone_df
+from src.transform.version_set import VersionSet
+
+
+def make_versions():
+    base = pd.DataFrame({"Length": [0.1, 0.2], "Class": [0, 1]})
+    return {
+        f"abalone_df_{5 * n}": pd.concat(
+            [base, pd.DataFrame({"Length": [0.3] * n, "Class": [1] * n})],
+            ignore_index=True,
+        )
+        for n in (1, 2, 3)
+    }
+
+
+def test_merge_matches_tag_then_concat():
+    expected = pd.concat(
+        add_tag_to_data_versions(make_versions()).values(), ignore_index=True
+    )
+
+    result = merge_abalone_df(make_versions())
+
+    assert isinstance(result.index, pd.RangeIndex)
+    assert result["IR"].dtype == np.int8
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    assert (result.dtypes[["Length", "Class"]] == expected.dtypes[:2]).all()
+
+
+def test_merge_uses_given_or_existing_tags():
+    versions = make_versions()
+    tags = {"abalone_df_5": 200, "abalone_df_10": 300, "abalone_df_15": 400}
+
+    result = merge_abalone_df(versions, tags=tags)
+    assert result["IR"].dtype == np.int16
+    assert result["IR"].unique().tolist() == [200, 300, 400]
+
+    for name, df in versions.items():
+        df["IR"] = tags[name] - 100
+    assert merge_abalone_df(versions)["IR"].unique().tolist() == [
+        100,
+        200,
+        300,
+    ]
+
+
+def test_merge_fills_version_set_from_shared_rows():
+    versions = make_versions()
+    version_set = add_tag_to_data_versions(
+        VersionSet.from_versions(versions.items(), n_base=2)
+    )
+
+    result = merge_abalone_df(version_set)
+
+    pd.testing.assert_frame_equal(result, merge_abalone_df(versions))
+
+
+def test_merge_rejects_empty_input():
+    with pytest.raises(ValueError, match="empty"):
+        merge_abalone_df({})
+
+
+def test_merge_labels_versions_with_kind_and_seed():
+    versions = make_versions()
+    labels = {
+        "Kind": dict(zip(versions, ["borderline-2", "borderline-1"] * 2)),
+        "Seed": dict(zip(versions, [7, 42, 7])),
+    }
+    tags = dict.fromkeys(versions, 10)
+    expected = pd.concat(
+        add_tag_to_data_versions(
+            make_versions(), tags=tags, labels=labels
+        ).values(),
+        ignore_index=True,
+    )
+
+    result = merge_abalone_df(versions, tags=tags, labels=labels)
+
+    assert result.columns.tolist() == ["Length", "Class", "Kind", "Seed", "IR"]
+    assert result["Kind"].cat.categories.tolist() == [
+        "borderline-2",
+        "borderline-1",
+    ]
+    assert result["Seed"].dtype == np.int8
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    version_set = VersionSet.from_versions(versions.items(), n_base=2)
+    pd.testing.assert_frame_equal(
+        merge_abalone_df(version_set, tags=tags, labels=labels), result
+    )
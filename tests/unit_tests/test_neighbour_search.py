@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from src.transform.neighbour_search import (
+    NEIGHBOUR_BACKENDS,
+    brute_kneighbors,
+    kneighbors,
+)
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.RandomState(0)
+    data = rng.normal(size=(2000, 6))
+    return data, data[rng.choice(len(data), 100, replace=False)]
+
+
+@pytest.mark.parametrize(
+    "algorithm", ["brute", "kd_tree", "ball_tree", "ckdtree"]
+)
+def test_exact_backends_agree_with_default_search(points, algorithm):
+    data, queries = points
+    expected = kneighbors(data, queries, 6)
+
+    result = kneighbors(data, queries, 6, algorithm=algorithm)
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_brute_search_is_independent_of_block_size(points):
+    data, queries = points
+
+    result = brute_kneighbors(data, queries, 6, block_elements=7 * len(data))
+
+    np.testing.assert_array_equal(result, kneighbors(data, queries, 6))
+
+
+def test_approximate_search_has_high_recall(points):
+    data, queries = points
+    exact = kneighbors(data, queries, 11)
+
+    result = kneighbors(data, queries, 11, algorithm="approximate")
+
+    assert result.shape == exact.shape
+    assert (result[:, 0] == exact[:, 0]).all()
+    assert all(len(set(row)) == 11 for row in result)
+    recall = np.mean(
+        [len(set(a) & set(b)) / 11 for a, b in zip(result, exact)]
+    )
+    assert recall > 0.9
+
+
+def test_kneighbors_rejects_unknown_backend(points):
+    with pytest.raises(ValueError, match="Unknown neighbour search"):
+        kneighbors(*points, 5, algorithm="hnsw")
+    assert "approximate" in NEIGHBOUR_BACKENDS
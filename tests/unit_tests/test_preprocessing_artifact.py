@@ -0,0 +1,84 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.transform.preprocessing_artifact import (
+    ARTIFACT_VERSION,
+    load_preprocessing_artifact,
+    save_preprocessing_artifact,
+)
+from src.transform.standardize_encode_abalone import (
+    apply_standardize_encode,
+    fit_standardize_encode,
+    standardize_and_encode,
+)
+from src.transform.transform import preprocess_data
+
+
+@pytest.fixture
+def abalone_df():
+    return pd.read_csv(FILE_PATH)
+
+
+def test_artifact_round_trip_is_exact(abalone_df, tmp_path):
+    params = fit_standardize_encode(abalone_df)
+
+    loaded = load_preprocessing_artifact(
+        save_preprocessing_artifact(params, str(tmp_path))
+    )
+
+    assert loaded["numeric_columns"] == params["numeric_columns"]
+    assert loaded["categories"] == params["categories"]
+    np.testing.assert_array_equal(loaded["mean"], params["mean"])
+    np.testing.assert_array_equal(loaded["scale"], params["scale"])
+
+
+def test_artifact_name_is_versioned_by_content(abalone_df, tmp_path):
+    params = fit_standardize_encode(abalone_df)
+
+    first = save_preprocessing_artifact(params, str(tmp_path))
+    second = save_preprocessing_artifact(params, str(tmp_path))
+    other = save_preprocessing_artifact(
+        fit_standardize_encode(abalone_df.iloc[:100]), str(tmp_path)
+    )
+
+    assert first == second
+    assert first != other
+    assert f"preprocessing_v{ARTIFACT_VERSION}_" in first
+
+
+def test_load_rejects_other_artifact_versions(abalone_df, tmp_path):
+    path = save_preprocessing_artifact(
+        fit_standardize_encode(abalone_df), str(tmp_path)
+    )
+    with open(path) as file:
+        artifact = json.load(file)
+    artifact["artifact_version"] = ARTIFACT_VERSION + 1
+    with open(path, "w") as file:
+        json.dump(artifact, file)
+
+    with pytest.raises(ValueError, match="Unsupported"):
+        load_preprocessing_artifact(path)
+
+
+def test_preprocess_data_applies_stored_fit_without_refitting(
+    abalone_df, tmp_path, mocker
+):
+    path = save_preprocessing_artifact(
+        fit_standardize_encode(abalone_df), str(tmp_path)
+    )
+    new_batch = abalone_df.iloc[:50]
+    mock_fit = mocker.patch("src.transform.transform.fit_standardize_encode")
+
+    result = preprocess_data(new_batch, path)
+
+    mock_fit.assert_not_called()
+    pd.testing.assert_frame_equal(
+        result, standardize_and_encode(abalone_df).iloc[:50]
+    )
+    assert not result.equals(
+        apply_standardize_encode(
+            new_batch, fit_standardize_encode(new_batch)
+        )
+    )
@@ -0,0 +1,97 @@
+import pytest
+import pandas as pd
+from src.extract.extract_abalone import FILE_PATH
+from src.extract.read_abalone_csv import (
+    read_abalone_csv,
+    abalone_read_csv_kwargs,
+    apply_abalone_schema,
+    filter_abalone_chunk,
+    ABALONE_COLUMNS,
+    ABALONE_SCHEMA,
+)
+
+
+def test_read_abalone_csv_applies_declared_schema():
+    df = read_abalone_csv(FILE_PATH)
+
+    assert df.columns.tolist() == ABALONE_COLUMNS
+    for col, dtype in ABALONE_SCHEMA.items():
+        assert df[col].dtype == dtype
+    assert df["Sex"].cat.categories.tolist() == ["F", "I", "M"]
+    assert set(df["Class"].unique()) == {0, 1}
+
+
+def test_read_abalone_csv_matches_inferred_values():
+    typed = read_abalone_csv(FILE_PATH)
+    inferred = pd.read_csv(FILE_PATH)
+    inferred.columns = inferred.columns.str.strip()
+
+    assert len(typed) == len(inferred)
+    assert typed["Sex"].astype(str).tolist() == inferred["Sex"].tolist()
+    assert (
+        typed["Class"].tolist()
+        == (inferred["Class"] == "positive").astype(int).tolist()
+    )
+    pd.testing.assert_frame_equal(
+        typed[ABALONE_COLUMNS[1:8]],
+        inferred[ABALONE_COLUMNS[1:8]].astype("float32"),
+    )
+
+
+def test_read_abalone_csv_smaller_than_inferred_frame():
+    typed = read_abalone_csv(FILE_PATH)
+    inferred = pd.read_csv(FILE_PATH)
+
+    assert (
+        typed.memory_usage(deep=True).sum()
+        < inferred.memory_usage(deep=True).sum() / 2
+    )
+
+
+def test_pandas_kwargs_match_arrow_reader():
+    chunked = pd.concat(
+        (
+            apply_abalone_schema(chunk)
+            for chunk in pd.read_csv(
+                FILE_PATH, chunksize=1000, **abalone_read_csv_kwargs()
+            )
+        ),
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(chunked, read_abalone_csv(FILE_PATH))
+
+
+def test_read_abalone_csv_pushes_down_projection_and_filters():
+    filters = [("Sex", "==", "M"), ("Class", "==", 1)]
+    full = read_abalone_csv(FILE_PATH)
+    expected = full[(full["Sex"] == "M") & (full["Class"] == 1)]
+
+    df = read_abalone_csv(FILE_PATH, columns=["Length"], filters=filters)
+
+    assert df.columns.tolist() == ["Length"]
+    assert df["Length"].tolist() == expected["Length"].tolist()
+
+
+@pytest.mark.parametrize("op", [">=", ">", "==", "<="])
+def test_filter_abalone_chunk_matches_arrow_reader(op):
+    # Heights of exactly 0.2 are stored as float32, so strict comparisons
+    # only agree when both paths compare at float32
+    columns = ["Sex", "Height"]
+    filters = [("Height", op, 0.2)]
+
+    chunked = pd.concat(
+        (
+            filter_abalone_chunk(chunk, columns, filters)
+            for chunk in pd.read_csv(
+                FILE_PATH,
+                chunksize=700,
+                **abalone_read_csv_kwargs(columns, filters),
+            )
+        ),
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(
+        chunked, read_abalone_csv(FILE_PATH, columns=columns, filters=filters)
+    )
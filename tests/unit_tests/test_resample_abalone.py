@@ -0,0 +1,285 @@
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.transform.resample_abalone import (
+    RATIO_VALUES,
+    build_version_grid,
+    generate_imb_data_version,
+    generate_replicate_set,
+    generate_version_set,
+    grid_labels,
+    iter_imb_data_versions,
+    resample_with_borderline_smote,
+)
+from src.transform.standardize_encode_abalone import standardize_and_encode
+
+
+@pytest.fixture(scope="module")
+def encoded_abalone():
+    return standardize_and_encode(pd.read_csv(FILE_PATH))
+
+
+def test_generate_imb_data_version_names_one_version_per_ratio(
+    encoded_abalone,
+):
+    versions = generate_imb_data_version(encoded_abalone)
+
+    assert list(versions) == [
+        f"abalone_df_{int(ratio * 100)}" for ratio in RATIO_VALUES
+    ]
+    majority = (encoded_abalone["Class"] == 0).sum()
+    assert (versions["abalone_df_100"]["Class"] == 1).sum() == majority
+
+
+def test_parallel_versions_match_serial_versions(encoded_abalone):
+    serial = generate_imb_data_version(encoded_abalone)
+
+    parallel = generate_imb_data_version(encoded_abalone, workers=2)
+
+    assert list(parallel) == list(serial)
+    for name, version in serial.items():
+        pd.testing.assert_frame_equal(parallel[name], version)
+
+
+def test_shared_neighbours_match_per_ratio_borderline_smote(encoded_abalone):
+    expected = generate_imb_data_version(
+        encoded_abalone, share_neighbours=False
+    )
+
+    result = generate_imb_data_version(encoded_abalone)
+
+    for name, version in expected.items():
+        pd.testing.assert_frame_equal(result[name], version)
+
+
+def test_nested_versions_are_prefixes_of_each_other(encoded_abalone):
+    versions = list(
+        generate_imb_data_version(encoded_abalone, nested=True).values()
+    )
+
+    for smaller, larger in zip(versions, versions[1:]):
+        assert len(smaller) < len(larger)
+        pd.testing.assert_frame_equal(smaller, larger.iloc[: len(smaller)])
+    assert versions[0].iloc[: len(encoded_abalone)].equals(
+        encoded_abalone.astype(versions[0].dtypes.to_dict())
+    )
+
+
+def test_nested_versions_require_shared_neighbours(encoded_abalone):
+    with pytest.raises(ValueError, match="share_neighbours"):
+        generate_imb_data_version(
+            encoded_abalone, share_neighbours=False, nested=True
+        )
+
+
+def test_iter_versions_yields_the_same_versions_lazily(encoded_abalone):
+    expected = generate_imb_data_version(encoded_abalone)
+
+    versions = iter_imb_data_versions(encoded_abalone)
+
+    assert not isinstance(versions, dict)
+    for (name, version), expected_name in zip(versions, expected):
+        assert name == expected_name
+        pd.testing.assert_frame_equal(version, expected[name])
+
+
+def test_iter_versions_checks_options_before_iterating(encoded_abalone):
+    with pytest.raises(ValueError, match="Unknown resampling engine"):
+        iter_imb_data_versions(encoded_abalone, engine="unknown")
+
+
+def test_build_version_grid_dedupes_and_tags_by_ratio():
+    grid = build_version_grid(ratios=[0.3, 0.05, 0.3], seeds=[42, 42])
+
+    assert [job["name"] for job in grid] == ["abalone_df_30", "abalone_df_5"]
+    assert [job["ir"] for job in grid] == [30, 5]
+
+
+def test_build_version_grid_names_kinds_and_seeds_when_varied():
+    grid = build_version_grid(
+        ratios=[0.5], kinds=["borderline-1", "borderline-2"], seeds=[1, 2]
+    )
+
+    assert [job["name"] for job in grid] == [
+        "abalone_df_50_borderline1_seed1",
+        "abalone_df_50_borderline1_seed2",
+        "abalone_df_50_borderline2_seed1",
+        "abalone_df_50_borderline2_seed2",
+    ]
+
+
+def test_grid_labels_only_label_grids_of_several_kinds_or_seeds():
+    grid = build_version_grid(ratios=[0.5], seeds=[1, 2])
+
+    assert grid_labels(grid) == {
+        "Seed": {"abalone_df_50_seed1": 1, "abalone_df_50_seed2": 2}
+    }
+    assert grid_labels(
+        build_version_grid(ratios=[0.1, 0.5], kinds=["borderline-2"])
+    ) == {}
+
+
+def test_build_version_grid_rejects_ratios_sharing_a_tag():
+    with pytest.raises(ValueError, match="same IR tag"):
+        build_version_grid(ratios=[0.5, 0.501])
+
+
+def test_build_version_grid_rejects_ratios_without_a_tag():
+    with pytest.raises(ValueError, match="no IR tag"):
+        build_version_grid(ratios=[0.004, 0.5])
+
+
+def test_build_version_grid_rejects_unknown_kinds():
+    with pytest.raises(ValueError, match="kind must be one of"):
+        build_version_grid(kinds=["borderline-3"])
+
+
+def test_grid_versions_match_imblearn_per_kind_and_seed(encoded_abalone):
+    grid = build_version_grid(
+        ratios=[0.6, 0.9], kinds=["borderline-1", "borderline-2"], seeds=[0, 7]
+    )
+    X = encoded_abalone.drop(columns=["Class"])
+    y = encoded_abalone["Class"]
+
+    versions = generate_imb_data_version(encoded_abalone, grid=grid)
+
+    assert list(versions) == [job["name"] for job in grid]
+    for job in grid:
+        expected = resample_with_borderline_smote(
+            X, y, job["ratio"], kind=job["kind"], random_state=job["seed"]
+        )
+        pd.testing.assert_frame_equal(versions[job["name"]], expected)
+
+
+def test_parallel_grid_matches_serial_grid(encoded_abalone):
+    grid = build_version_grid(
+        ratios=[0.5, 1.0], kinds=["borderline-1", "borderline-2"], seeds=[3]
+    )
+    serial = generate_imb_data_version(encoded_abalone, grid=grid)
+
+    parallel = generate_imb_data_version(encoded_abalone, workers=2, grid=grid)
+
+    for name, version in serial.items():
+        pd.testing.assert_frame_equal(parallel[name], version)
+
+
+def test_nested_version_set_keeps_a_pool_per_seed(encoded_abalone):
+    grid = build_version_grid(ratios=[0.25, 0.75], seeds=[1, 2])
+    expected = generate_imb_data_version(
+        encoded_abalone, grid=grid, nested=True
+    )
+
+    version_set = generate_version_set(
+        encoded_abalone, grid=grid, nested=True
+    )
+
+    for name, version in expected.items():
+        pd.testing.assert_frame_equal(version_set[name], version)
+
+
+def test_kinds_only_apply_to_borderline_smote(encoded_abalone):
+    with pytest.raises(ValueError, match="only apply to the borderline"):
+        iter_imb_data_versions(
+            encoded_abalone,
+            engine="smote",
+            grid=build_version_grid(kinds=["borderline-2"]),
+        )
+
+
+def test_replicate_set_has_a_tagged_version_per_ratio_and_replicate(
+    encoded_abalone,
+):
+    replicates = generate_replicate_set(
+        encoded_abalone, 3, ratios=[0.5, 1.0], random_state=1
+    )
+
+    assert replicates.names == [
+        f"abalone_df_{ir}_rep{replicate}"
+        for ir in (50, 100)
+        for replicate in range(3)
+    ]
+    majority = (encoded_abalone["Class"] == 0).sum()
+    expected = generate_imb_data_version(encoded_abalone)
+    for replicate in range(3):
+        version = replicates[f"abalone_df_100_rep{replicate}"]
+        assert (version["IR"] == 100).all()
+        assert (version["Replicate"] == replicate).all()
+        assert (version["Class"] == 1).sum() == majority
+        pd.testing.assert_index_equal(
+            version.columns.drop(["Replicate", "IR"]),
+            expected["abalone_df_100"].columns,
+        )
+    assert not replicates["abalone_df_50_rep0"].equals(
+        replicates["abalone_df_50_rep1"]
+    )
+
+
+def test_nested_replicates_are_prefixes_within_a_replicate(encoded_abalone):
+    replicates = generate_replicate_set(
+        encoded_abalone, 2, ratios=[0.5, 1.0], nested=True
+    )
+
+    for replicate in range(2):
+        low = replicates[f"abalone_df_50_rep{replicate}"].drop(columns="IR")
+        high = replicates[f"abalone_df_100_rep{replicate}"].drop(
+            columns="IR"
+        )
+        pd.testing.assert_frame_equal(low, high.iloc[:len(low)])
+
+
+def test_replicate_set_needs_a_replicate(encoded_abalone):
+    with pytest.raises(ValueError, match="n_replicates"):
+        generate_replicate_set(encoded_abalone, 0)
+
+
+def test_memory_is_only_traced_when_asked_for(encoded_abalone, mocker):
+    grid = build_version_grid(ratios=[0.5])
+    start = mocker.patch("tracemalloc.start")
+    log = mocker.patch(
+        "src.transform.resample_abalone.log_resample_success"
+    )
+
+    generate_imb_data_version(encoded_abalone, grid=grid)
+
+    start.assert_not_called()
+    assert all(call.args[5] is None for call in log.call_args_list)
+
+    mocker.stopall()
+    log = mocker.patch(
+        "src.transform.resample_abalone.log_resample_success"
+    )
+    generate_imb_data_version(encoded_abalone, grid=grid, profile_memory=True)
+
+    assert all(call.args[5] > 0 for call in log.call_args_list)
+
+
+def test_ratios_below_the_current_share_keep_the_data(encoded_abalone):
+    grid = build_version_grid(ratios=[0.006, 0.5])
+
+    versions = generate_imb_data_version(encoded_abalone, grid=grid)
+    replicates = generate_replicate_set(encoded_abalone, 2, ratios=[0.006])
+
+    pd.testing.assert_frame_equal(versions["abalone_df_1"], encoded_abalone)
+    assert replicates.n_rows("abalone_df_1_rep1") == len(encoded_abalone)
+
+
+def test_replicates_are_drawn_independently_across_ratios(encoded_abalone):
+    replicates = generate_replicate_set(
+        encoded_abalone, 2, ratios=[0.5, 1.0], random_state=4
+    )
+
+    low = replicates.views("abalone_df_50_rep0")[1].reset_index(drop=True)
+    high = replicates.views("abalone_df_100_rep0")[1]
+    assert replicates.replicates["abalone_df_100_rep1"] == 1
+    assert not low.equals(high.iloc[:len(low)].reset_index(drop=True))
+
+
+def test_parallel_replicates_match_serial_replicates(encoded_abalone):
+    serial = generate_replicate_set(encoded_abalone, 2, ratios=[0.5, 1.0])
+
+    parallel = generate_replicate_set(
+        encoded_abalone, 2, ratios=[0.5, 1.0], workers=2
+    )
+
+    for name in serial:
+        pd.testing.assert_frame_equal(parallel[name], serial[name])
@@ -0,0 +1,68 @@
+import os
+import pytest
+from config.resample_config import load_resample_config, ResampleConfigError
+
+
+def test_load_resample_config(mocker):
+    mocker.patch.dict(os.environ, {
+        'RESAMPLE_RATIOS': '0.1, 0.5,1.0',
+        'RESAMPLE_KINDS': 'borderline-1,borderline-2',
+        'RESAMPLE_SEEDS': '42,7',
+        'RESAMPLE_WORKERS': '4',
+        'RESAMPLE_REPLICATES': '1',
+    })
+
+    config = load_resample_config()
+
+    assert config['ratios'] == [0.1, 0.5, 1.0]
+    assert config['kinds'] == ['borderline-1', 'borderline-2']
+    assert config['seeds'] == [42, 7]
+    assert config['workers'] == 4
+
+
+def test_load_resample_config_defaults(mocker):
+    mocker.patch.dict(os.environ, {}, clear=True)
+
+    config = load_resample_config()
+
+    assert len(config['ratios']) == 20
+    assert config['ratios'][0] == 0.05 and config['ratios'][-1] == 1.0
+    assert config['kinds'] == ['borderline-1']
+    assert config['seeds'] == [42]
+    assert config['workers'] is None
+    assert config['replicates'] == 1
+
+
+@pytest.mark.parametrize("key, value", [
+    ('RESAMPLE_RATIOS', '0.5,1.5'),
+    ('RESAMPLE_RATIOS', '0.5,half'),
+    ('RESAMPLE_RATIOS', ' , '),
+    ('RESAMPLE_RATIOS', '0.004'),
+    ('RESAMPLE_SEEDS', '-1'),
+    ('RESAMPLE_WORKERS', '0'),
+    ('RESAMPLE_REPLICATES', '0'),
+    ('RESAMPLE_REPLICATES', '10,20'),
+    ('RESAMPLE_WORKERS', '2,4'),
+])
+def test_load_resample_config_invalid_values(mocker, key, value):
+    mocker.patch.dict(os.environ, {key: value}, clear=True)
+
+    with pytest.raises(ResampleConfigError, match=key):
+        load_resample_config()
+
+
+def test_load_resample_config_replicates_need_one_seed(mocker):
+    mocker.patch.dict(os.environ, {
+        'RESAMPLE_SEEDS': '1,2',
+        'RESAMPLE_REPLICATES': '10',
+    }, clear=True)
+
+    with pytest.raises(ResampleConfigError, match="RESAMPLE_REPLICATES"):
+        load_resample_config()
+
+
+def test_resample_config_errors_are_value_errors(mocker):
+    mocker.patch.dict(os.environ, {'RESAMPLE_REPLICATES': '10,20'}, clear=True)
+
+    with pytest.raises(ValueError, match="single value"):
+        load_resample_config()
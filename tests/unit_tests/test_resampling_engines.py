@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.transform.resample_abalone import generate_imb_data_version
+from src.transform.resampling_engines import (
+    RESAMPLING_ENGINES,
+    get_resampling_engine,
+)
+from src.transform.standardize_encode_abalone import standardize_and_encode
+
+
+@pytest.fixture(scope="module")
+def abalone_xy():
+    encoded = standardize_and_encode(pd.read_csv(FILE_PATH))
+    return encoded.drop(columns=["Class"]), encoded["Class"]
+
+
+@pytest.mark.parametrize("name", list(RESAMPLING_ENGINES))
+def test_engines_share_the_version_contract(abalone_xy, name):
+    X, y = abalone_xy
+    engine = get_resampling_engine(name)
+
+    result = engine["resample"](engine["prepare"](X, y), 0.5)
+
+    assert result.columns.tolist() == X.columns.tolist() + ["Class"]
+    assert isinstance(result.index, pd.RangeIndex)
+    counts = result["Class"].value_counts()
+    assert counts[1] / counts[0] == pytest.approx(0.5, abs=0.02)
+
+
+def test_undersampling_keeps_every_minority_row(abalone_xy):
+    X, y = abalone_xy
+    engine = get_resampling_engine("random_undersampling")
+
+    result = engine["resample"](engine["prepare"](X, y), 0.25)
+
+    assert (result["Class"] == 1).sum() == (y == 1).sum()
+    assert (result["Class"] == 0).sum() == (y == 1).sum() * 4
+
+
+def test_generate_imb_data_version_with_another_engine(abalone_xy):
+    X, y = abalone_xy
+    df = X.assign(Class=y)
+
+    versions = generate_imb_data_version(df, engine="random_oversampling")
+
+    assert len(versions) == 20
+    assert (versions["abalone_df_100"]["Class"] == 1).sum() == (y == 0).sum()
+
+
+def test_borderline_options_are_rejected_for_other_engines(abalone_xy):
+    X, y = abalone_xy
+
+    with pytest.raises(ValueError, match="only apply to the borderline"):
+        generate_imb_data_version(
+            X.assign(Class=y), engine="smote", nested=True
+        )
+
+
+def test_get_resampling_engine_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown resampling engine"):
+        get_resampling_engine("tomek_links")
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.extract.read_abalone_csv import read_abalone_csv
+from src.transform.encode_abalone import encode_abalone
+from src.transform.standardize_abalone import standardize_data
+from src.transform.standardize_encode_abalone import (
+    apply_standardize_encode,
+    fit_standardize_encode,
+    standardize_and_encode,
+)
+
+
+@pytest.fixture
+def abalone_df():
+    return pd.read_csv(FILE_PATH)
+
+
+def test_standardize_and_encode_matches_separate_stages(abalone_df):
+    expected = encode_abalone(standardize_data(abalone_df.copy()))
+
+    result = standardize_and_encode(abalone_df)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_standardize_and_encode_keeps_typed_frame_compact():
+    typed_df = read_abalone_csv(FILE_PATH)
+    expected = encode_abalone(standardize_data(typed_df.copy()))
+
+    result = standardize_and_encode(typed_df)
+
+    assert result.columns.tolist() == expected.columns.tolist()
+    assert (result.dtypes.iloc[:-1] == np.float32).all()
+    assert result["Class"].dtype == np.int8
+    pd.testing.assert_frame_equal(
+        result, expected, check_dtype=False, atol=1e-5
+    )
+
+
+def test_standardize_and_encode_does_not_modify_input(abalone_df):
+    original = abalone_df.copy()
+
+    standardize_and_encode(abalone_df)
+
+    pd.testing.assert_frame_equal(abalone_df, original)
+
+
+def test_fit_standardize_encode_leaves_constant_columns_unscaled(abalone_df):
+    abalone_df[" Height"] = 0.25
+
+    params = fit_standardize_encode(abalone_df)
+    result = apply_standardize_encode(abalone_df, params)
+
+    assert params["scale"][2] == 1.0
+    assert (result[" Height"] == 0.0).all()
+
+
+def test_apply_standardize_encode_rejects_unknown_categories(abalone_df):
+    params = fit_standardize_encode(abalone_df)
+    abalone_df.loc[0, "Sex"] = "X"
+
+    with pytest.raises(ValueError, match="Unknown 'Sex' categories"):
+        apply_standardize_encode(abalone_df, params)
+
+
+def test_apply_standardize_encode_can_ignore_unknown_categories(abalone_df):
+    params = fit_standardize_encode(abalone_df)
+    abalone_df.loc[0, "Sex"] = "X"
+
+    result = apply_standardize_encode(
+        abalone_df, params, handle_unknown="ignore"
+    )
+
+    assert result.loc[0, ["Sex_F", "Sex_I", "Sex_M"]].sum() == 0
+    assert result.loc[1:, ["Sex_F", "Sex_I", "Sex_M"]].sum(axis=1).eq(1).all()
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH, extract_abalone
+from src.transform.standardize_encode_abalone import (
+    fit_standardize_encode,
+    standardize_and_encode,
+)
+from src.transform.streaming_standardize import (
+    fit_streaming_standardize_encode,
+    standardize_encode_chunks,
+    stream_standardize_encode,
+)
+
+
+@pytest.fixture
+def abalone_df():
+    return pd.read_csv(FILE_PATH)
+
+
+def chunks_of(df, size):
+    return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+@pytest.mark.parametrize("size", [1, 7, 1000, 10000])
+def test_streaming_fit_matches_full_fit(abalone_df, size):
+    expected = fit_standardize_encode(abalone_df)
+
+    params = fit_streaming_standardize_encode(chunks_of(abalone_df, size))
+
+    assert params["numeric_columns"] == expected["numeric_columns"]
+    assert params["categories"] == expected["categories"]
+    np.testing.assert_allclose(params["mean"], expected["mean"], rtol=1e-12)
+    np.testing.assert_allclose(params["scale"], expected["scale"], rtol=1e-12)
+
+
+def test_streaming_fit_is_stable_with_large_offset():
+    rng = np.random.default_rng(0)
+    values = 1e9 + rng.normal(size=(10000, 7))
+    df = pd.DataFrame(values, columns=[f"m{i}" for i in range(7)])
+    df.insert(0, "Sex", "M")
+    df["Class"] = 0
+
+    params = fit_streaming_standardize_encode(chunks_of(df, 333))
+
+    np.testing.assert_allclose(params["scale"], values.std(axis=0), rtol=1e-6)
+
+
+def test_streaming_fit_rejects_empty_input():
+    with pytest.raises(ValueError):
+        fit_streaming_standardize_encode(iter([]))
+
+
+def test_stream_standardize_encode_matches_full_transform(abalone_df):
+    params = fit_streaming_standardize_encode(chunks_of(abalone_df, 500))
+
+    result = pd.concat(
+        stream_standardize_encode(chunks_of(abalone_df, 500), params),
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(
+        result, standardize_and_encode(abalone_df), rtol=1e-10
+    )
+
+
+def test_standardize_encode_chunks_over_chunked_extraction(
+    abalone_df, mocker
+):
+    mocker.patch("src.extract.extract_abalone.log_extract_success")
+    mocker.patch("src.extract.extract_abalone.log_extract_chunk_success")
+
+    result = pd.concat(
+        standardize_encode_chunks(lambda: extract_abalone(chunksize=1000)),
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(
+        result, standardize_and_encode(abalone_df), rtol=1e-10
+    )
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.transform.transform import transform_data
+
+REPLICATE_CONFIG = {
+    "ratios": [0.3, 0.6],
+    "kinds": ["borderline-1"],
+    "seeds": [1],
+    "workers": None,
+    "replicates": 3,
+}
+
+
+@pytest.fixture(autouse=True)
+def no_side_files(mocker):
+    mocker.patch("src.transform.clean_abalone.save_dataframe_to_csv")
+    mocker.patch(
+        "src.transform.transform.save_preprocessing_artifact",
+        return_value="artifact.json",
+    )
+
+
+@pytest.mark.parametrize("delta_versions", [True, False])
+def test_streamed_replicates_match_the_merged_frame(delta_versions):
+    merged = transform_data(
+        pd.read_csv(FILE_PATH),
+        resample_config=REPLICATE_CONFIG,
+        delta_versions=delta_versions,
+    )
+
+    streamed = transform_data(
+        pd.read_csv(FILE_PATH),
+        resample_config=REPLICATE_CONFIG,
+        stream_versions=True,
+    )
+    streamed = pd.concat([df for _, df in streamed], ignore_index=True)
+
+    assert merged.columns.tolist() == streamed.columns.tolist()
+    assert merged.columns[-2:].tolist() == ["Replicate", "IR"]
+    pd.testing.assert_frame_equal(merged, streamed, check_dtype=False)
+    sizes = merged.groupby(["IR", "Replicate"]).size()
+    assert sizes.index.tolist() == [
+        (ir, replicate) for ir in (30, 60) for replicate in range(3)
+    ]
+
+
+GRID_CONFIG = {
+    "ratios": [0.1, 0.5],
+    "kinds": ["borderline-1", "borderline-2"],
+    "seeds": [42, 7],
+    "workers": None,
+    "replicates": 1,
+}
+
+
+@pytest.mark.parametrize("delta_versions", [True, False])
+def test_grid_versions_are_labelled_with_kind_and_seed(delta_versions):
+    merged = transform_data(
+        pd.read_csv(FILE_PATH),
+        resample_config=GRID_CONFIG,
+        delta_versions=delta_versions,
+    )
+
+    streamed = transform_data(
+        pd.read_csv(FILE_PATH),
+        resample_config=GRID_CONFIG,
+        stream_versions=True,
+    )
+    streamed = pd.concat([df for _, df in streamed], ignore_index=True)
+
+    assert merged.columns[-3:].tolist() == ["Kind", "Seed", "IR"]
+    assert merged.columns.tolist() == streamed.columns.tolist()
+    assert isinstance(merged["Kind"].dtype, pd.CategoricalDtype)
+    for frame in (merged, streamed):
+        sizes = frame.groupby(
+            ["IR", "Kind", "Seed"], observed=True
+        ).size()
+        assert sorted(sizes.index.tolist()) == sorted(
+            (ir, kind, seed)
+            for ir in (10, 50)
+            for kind in GRID_CONFIG["kinds"]
+            for seed in GRID_CONFIG["seeds"]
+        )
+        # Each version keeps its own rows instead of sharing its IR's
+        for ir in (10, 50):
+            assert sizes.loc[ir].nunique() == 1
+    pd.testing.assert_frame_equal(merged, streamed, check_dtype=False)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.extract.extract_abalone import FILE_PATH
+from src.load.write_data_to_csv import write_data_versions_to_csv
+from src.transform.add_imbalance_tag import add_tag_to_data_versions
+from src.transform.merge_abalone_data_versions import merge_abalone_df
+from src.transform.resample_abalone import (
+    generate_imb_data_version,
+    generate_version_set,
+)
+from src.transform.standardize_encode_abalone import standardize_and_encode
+from src.transform.version_set import VersionSet
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="module")
+def encoded_abalone():
+    return standardize_and_encode(pd.read_csv(FILE_PATH))
+
+
+def test_version_set_materializes_the_same_versions(encoded_abalone):
+    expected = generate_imb_data_version(encoded_abalone)
+
+    version_set = generate_version_set(encoded_abalone)
+
+    assert version_set.names == list(expected)
+    for name, version in expected.items():
+        assert version_set.n_rows(name) == len(version)
+        pd.testing.assert_frame_equal(version_set[name], version)
+
+
+def test_version_set_stores_the_original_rows_once(encoded_abalone):
+    expected = generate_imb_data_version(encoded_abalone)
+
+    version_set = generate_version_set(encoded_abalone)
+
+    synthetic_rows = sum(
+        len(version) - len(encoded_abalone) for version in expected.values()
+    )
+    assert len(version_set.base) == len(encoded_abalone)
+    assert len(version_set.synthetic) == synthetic_rows
+    base, synthetic = version_set.views("abalone_df_50")
+    assert base is version_set.base
+    assert np.shares_memory(
+        synthetic["Class"].to_numpy(),
+        version_set.synthetic["Class"].to_numpy(),
+    )
+
+
+def test_nested_version_set_keeps_only_the_largest_pool(encoded_abalone):
+    nested = generate_imb_data_version(encoded_abalone, nested=True)
+
+    version_set = generate_version_set(encoded_abalone, nested=True)
+
+    assert len(version_set.synthetic) == (
+        len(nested["abalone_df_100"]) - len(encoded_abalone)
+    )
+    pd.testing.assert_frame_equal(
+        version_set["abalone_df_35"], nested["abalone_df_35"]
+    )
+
+
+def test_tagging_and_merging_accept_a_version_set(encoded_abalone):
+    expected = merge_abalone_df(
+        add_tag_to_data_versions(generate_imb_data_version(encoded_abalone))
+    )
+
+    version_set = add_tag_to_data_versions(
+        generate_version_set(encoded_abalone)
+    )
+
+    assert isinstance(version_set, VersionSet)
+    assert version_set.tags["abalone_df_100"] == 100
+    pd.testing.assert_frame_equal(merge_abalone_df(version_set), expected)
+
+
+@patch("pandas.DataFrame.to_csv")
+def test_csv_writer_accepts_a_version_set(mock_to_csv, encoded_abalone):
+    write_data_versions_to_csv(generate_version_set(encoded_abalone))
+
+    assert mock_to_csv.call_count == 20
+    assert mock_to_csv.call_args.args[0].endswith("abalone_df_100.csv")
+
+
+def test_version_set_rejects_under_sampled_versions(encoded_abalone):
+    with pytest.raises(ValueError, match="fewer rows than the original"):
+        generate_version_set(encoded_abalone, engine="random_undersampling")
+
+
+def test_version_set_rejects_versions_with_different_original_rows():
+    original = pd.DataFrame({"x": [1.0, 2.0, 3.0], "Class": [0, 0, 1]})
+    reordered = pd.concat(
+        [original.iloc[[1, 0, 2]], original.iloc[[2]]], ignore_index=True
+    )
+    versions = [
+        ("abalone_df_5", pd.concat([original, original.iloc[[2]]])),
+        ("abalone_df_10", reordered),
+    ]
+
+    with pytest.raises(ValueError, match="does not start with the original"):
+        VersionSet.from_versions(versions, n_base=len(original))